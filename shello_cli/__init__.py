@@ -20,12 +20,5 @@ if sys.stderr and hasattr(sys.stderr, "reconfigure"):
 logging.getLogger("shello").addHandler(logging.NullHandler())
 logging.getLogger("shello_cli").addHandler(logging.NullHandler())
 
-# Suppress verbose fastmcp logs (such as proxy warnings) at startup
-try:
-    import fastmcp
-    logging.getLogger("fastmcp").setLevel(logging.WARNING)
-except Exception:
-    pass
-
 __version__ = "0.8.2"
 
@@ -216,6 +216,9 @@ class MessageProcessor:
             accumulated_content = ""
             accumulated_tool_calls: List[Dict[str, Any]] = []
             tool_call_accumulator: Dict[int, Dict[str, Any]] = {}
+            # Argument fragments per tool call, joined once the stream ends
+            # (repeated += on the nested string is quadratic in its length)
+            argument_parts: Dict[int, List[str]] = {}
             
             for chunk in stream:
                 choices = chunk.get("choices", [])
@@ -246,6 +249,7 @@ class MessageProcessor:
                                     "arguments": ""
                                 }
                             }
+                            argument_parts[index] = []
                         
                         # Update tool call fields - only if value is not None
                         if "id" in tool_call_delta and tool_call_delta["id"] is not None:
@@ -256,10 +260,12 @@ class MessageProcessor:
                             if "name" in func_delta and func_delta["name"] is not None:
                                 tool_call_accumulator[index]["function"]["name"] = func_delta["name"]
                             if "arguments" in func_delta and func_delta["arguments"] is not None:
-                                tool_call_accumulator[index]["function"]["arguments"] += func_delta["arguments"]
+                                argument_parts[index].append(func_delta["arguments"])
             
             # Convert accumulated tool calls to list
             if tool_call_accumulator:
+                for index, parts in argument_parts.items():
+                    tool_call_accumulator[index]["function"]["arguments"] = "".join(parts)
                 accumulated_tool_calls = [
                     tool_call_accumulator[i]
                     for i in sorted(tool_call_accumulator.keys())
@@ -7,12 +7,12 @@ processes user messages, executes tools, and handles streaming responses.
 
 import json
 import platform
-from typing import List, Optional, Generator, Any, Dict, Union
+from typing import List, Optional, Generator, Any, Dict, Union, TYPE_CHECKING
 from datetime import datetime
 
 from shello_cli.api.openai_client import ShelloClient
 from shello_cli.tools.tools import get_tool_descriptions
-from shello_cli.agent.template import INSTRUCTION_TEMPLATE
+from shello_cli.agent.template import render_instruction_template
 from shello_cli.agent.models import ChatEntry, StreamingChunk
 from shello_cli.agent.tool_executor import ToolExecutor
 from shello_cli.agent.message_processor import MessageProcessor
@@ -23,11 +23,9 @@ from shello_cli.utils.system_info import (
 )
 from shello_cli.utils.output_utils import sanitize_surrogates
 
-# Import for type hints only
-try:
+# Import for type hints only (boto3 is loaded when a Bedrock client is created)
+if TYPE_CHECKING:
     from shello_cli.api.bedrock_client import ShelloBedrockClient
-except ImportError:
-    ShelloBedrockClient = None  # type: ignore
 
 
 class ShelloAgent:
@@ -82,14 +80,18 @@ class ShelloAgent:
         
         # Initialize conversation tracking
         self._chat_history: List[ChatEntry] = []
+        # The system message is added when the conversation starts (see
+        # _ensure_system_prompt), so sessions that never talk to the AI,
+        # e.g. only /help or /new, skip building the prompt
         self._messages: List[Dict[str, Any]] = []
-        
-        # Build and add system message
-        system_prompt = self._build_system_prompt()
-        self._messages.append({
-            "role": "system",
-            "content": system_prompt
-        })
+    
+    def _ensure_system_prompt(self) -> None:
+        """Add the system message if the conversation has no messages yet."""
+        if not self._messages:
+            self._messages.append({
+                "role": "system",
+                "content": self._build_system_prompt()
+            })
     
     def _build_system_prompt(self) -> str:
         """Build the system prompt with current system information.
@@ -116,7 +118,7 @@ class ShelloAgent:
         tool_descriptions = get_tool_descriptions()
         
         # Format the system prompt with current information
-        return INSTRUCTION_TEMPLATE.format(
+        return render_instruction_template(
             custom_instructions=custom_instructions_section,
             tool_descriptions=tool_descriptions,
             os_name=os_name,
@@ -150,6 +152,7 @@ class ShelloAgent:
         self._chat_history.append(user_entry)
         
         # Add user message to messages
+        self._ensure_system_prompt()
         self._messages.append({
             "role": "user",
             "content": message
@@ -187,6 +190,7 @@ class ShelloAgent:
         self._chat_history.append(user_entry)
         
         # Add user message to messages
+        self._ensure_system_prompt()
         self._messages.append({
             "role": "user",
             "content": message
@@ -214,6 +218,7 @@ class ShelloAgent:
         Args:
             message: The system message to add
         """
+        self._ensure_system_prompt()
         self._messages.append({
             "role": "system",
             "content": message
@@ -234,6 +239,7 @@ class ShelloAgent:
             tool_call_id: The ID of the interrupted tool call
             command: The command that was interrupted
         """
+        self._ensure_system_prompt()
         self._messages.append({
             "role": "tool",
             "tool_call_id": tool_call_id,
@@ -5,10 +5,42 @@ This module provides clients for interacting with various AI API providers,
 supporting chat completions with tool calling and streaming responses.
 """
 
-from shello_cli.api.openai_client import ShelloClient
-from shello_cli.api.bedrock_client import ShelloBedrockClient
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from shello_cli.api.openai_client import ShelloClient
+    from shello_cli.api.bedrock_client import ShelloBedrockClient
 
 __all__ = [
     "ShelloClient",
     "ShelloBedrockClient",
+    "DEBUG_OFF",
+    "DEBUG_SUMMARY",
+    "DEBUG_FULL",
+    "DEBUG_VERBOSE",
 ]
+
+# API debug logging levels, shared by the clients, the client factory and the CLI
+DEBUG_OFF = 0
+DEBUG_SUMMARY = 1  # One line per request/response from headers only
+DEBUG_FULL = 2  # Parsed request messages/tools and response choices/usage
+DEBUG_VERBOSE = 3  # Like DEBUG_FULL, but also dumps streaming requests in full
+
+# Client classes are resolved on first access so that importing this package
+# (e.g. for client_factory) does not load the openai SDK and boto3 up front.
+_LAZY_EXPORTS = {
+    "ShelloClient": "shello_cli.api.openai_client",
+    "ShelloBedrockClient": "shello_cli.api.bedrock_client",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    import importlib
+    
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
@@ -5,12 +5,296 @@ This module provides a client for interacting with AWS Bedrock using the Convers
 supporting chat completions with tool calling and streaming responses.
 """
 
+import re
+import json
+import time
+import random
+import functools
 import boto3
-from typing import List, Optional, Dict, Any, Generator
+from dataclasses import dataclass, field
+from typing import List, Optional, Dict, Any, Generator, Tuple
 from botocore.config import Config
 from botocore.exceptions import ClientError
 
 
+@functools.lru_cache(maxsize=8)
+def _make_config(region: str) -> Config:
+    """Return the shared botocore Config for a region.
+    
+    Config objects are never mutated after creation, so one instance per
+    region is reused by every client instead of being rebuilt each time.
+    
+    Args:
+        region: AWS region for the Bedrock service
+    
+    Returns:
+        botocore Config for bedrock-runtime clients in that region
+    """
+    return Config(
+        region_name=region,
+        user_agent_extra='shello-cli/1.0',
+        connect_timeout=5,
+        read_timeout=300,  # Important for streaming responses
+        tcp_keepalive=True,
+        max_pool_connections=32,
+        retries={'mode': 'adaptive', 'max_attempts': 5}
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _get_profile_session(profile: str) -> Any:
+    """Return the process-wide boto3 Session for an AWS profile.
+    
+    Clients created without a profile already share boto3's default session;
+    this gives profile-based clients the same reuse instead of resolving
+    credentials into a fresh Session on every client creation.
+    
+    Args:
+        profile: AWS profile name from credentials file
+    
+    Returns:
+        boto3 Session bound to the profile
+    """
+    return boto3.Session(profile_name=profile)
+
+
+@functools.lru_cache(maxsize=8)
+def _get_runtime_client(
+    region: str,
+    access_key: Optional[str],
+    secret_key: Optional[str],
+    session_token: Optional[str],
+    profile: Optional[str],
+    endpoint_url: Optional[str]
+) -> Any:
+    """Return the process-wide bedrock-runtime client for a connection setup.
+    
+    Building a boto3 client loads the service model and resolves credentials,
+    and each client owns its own connection pool. Caching by connection
+    settings lets new ShelloBedrockClient instances (e.g. on /new or a
+    provider switch) reuse the existing client and its warm connections.
+    botocore clients are thread-safe, so sharing them is fine.
+    
+    Args:
+        region: AWS region for the service
+        access_key: AWS access key ID
+        secret_key: AWS secret access key
+        session_token: Optional session token for temporary credentials
+        profile: AWS profile name from credentials file
+        endpoint_url: Optional custom endpoint URL
+    
+    Returns:
+        Configured boto3 bedrock-runtime client
+    """
+    # Configure boto3 client settings (shared per region)
+    config = _make_config(region)
+    
+    # Method 1: Use AWS profile
+    if profile:
+        session = _get_profile_session(profile)
+        return session.client(
+            service_name='bedrock-runtime',
+            config=config,
+            endpoint_url=endpoint_url
+        )
+    
+    # Method 2: Use explicit credentials
+    elif access_key and secret_key:
+        return boto3.client(
+            service_name='bedrock-runtime',
+            aws_access_key_id=access_key,
+            aws_secret_access_key=secret_key,
+            aws_session_token=session_token,
+            config=config,
+            endpoint_url=endpoint_url
+        )
+    
+    # Method 3: Use default AWS credential chain
+    else:
+        return boto3.client(
+            service_name='bedrock-runtime',
+            config=config,
+            endpoint_url=endpoint_url
+        )
+
+
+# Transient error codes that chat() retries with exponential backoff before
+# surfacing the error. These complement botocore's own adaptive retries.
+_RETRYABLE_ERROR_CODES = frozenset({
+    'ThrottlingException',
+    'ModelNotReadyException',
+    'ModelTimeoutException',
+    'ServiceUnavailableException',
+})
+_MAX_CONVERSE_ATTEMPTS = 5
+
+
+# Number of distinct tool lists whose toolConfig is kept per client
+_TOOLS_CACHE_SIZE = 4
+
+
+# Shared read-only default for optional sub-dicts of stream events; never mutated
+_EMPTY: Dict[str, Any] = {}
+
+# Buffered text size that forces a flush when chat_stream coalesces deltas
+_COALESCE_MAX_CHARS = 256
+
+
+# Bedrock stop reasons mapped to OpenAI finish reasons for streaming chunks
+_FINISH_REASON_MAP: Dict[str, str] = {
+    'end_turn': 'stop',
+    'max_tokens': 'length',
+    'stop_sequence': 'stop',
+    'tool_use': 'tool_calls',
+    'content_filtered': 'content_filter'
+}
+
+
+# ValidationException messages that mention any of these indicate the request
+# exceeded the model's context window rather than being malformed.
+_CONTEXT_ERROR_RE = re.compile(r'too long|context|token', re.IGNORECASE)
+
+_CONTEXT_WINDOW_TEMPLATE = (
+    "ValidationException - Context window exceeded. "
+    "The input is too long for the model's context window. "
+    "Please reduce the message history or input size. "
+    "Details: {message}"
+)
+
+# Descriptive messages for known Bedrock error codes. Placeholders: {message}
+# (the AWS error message), {model} and {region}.
+_ERROR_TEMPLATES: Dict[str, str] = {
+    'ValidationException': (
+        "ValidationException - Invalid request parameters. "
+        "Details: {message}"
+    ),
+    'ThrottlingException': (
+        "ThrottlingException - Rate limit exceeded. "
+        "Too many requests have been made. Please wait and retry. "
+        "Details: {message}"
+    ),
+    'AccessDeniedException': (
+        "AccessDeniedException - Access denied. "
+        "Check your AWS credentials and IAM permissions for Bedrock. "
+        "Required permissions: bedrock:InvokeModel. "
+        "Details: {message}"
+    ),
+    'ModelNotReadyException': (
+        "ModelNotReadyException - Model is not ready. "
+        "The model is still loading. Please wait a moment and retry. "
+        "Details: {message}"
+    ),
+    'ResourceNotFoundException': (
+        "ResourceNotFoundException - Model not found. "
+        "The specified model '{model}' does not exist or is not available in region '{region}'. "
+        "Details: {message}"
+    ),
+    'ModelTimeoutException': (
+        "ModelTimeoutException - Model timeout. "
+        "The model took too long to respond. Try reducing the input size or retry. "
+        "Details: {message}"
+    ),
+}
+
+
+def _text_chunk(text: str) -> Dict[str, Any]:
+    """Build an OpenAI-style streaming chunk carrying a text delta.
+    
+    Every yielded chunk is a fresh dict because consumers may keep references
+    to earlier chunks.
+    
+    Args:
+        text: Text fragment to emit
+    
+    Returns:
+        Chunk of the form {'choices': [{'delta': {'content': text}}]}
+    """
+    return {'choices': [{'delta': {'content': text}}]}
+
+
+def _openai_usage(usage: Dict[str, Any]) -> Dict[str, int]:
+    """Convert Bedrock token usage to the OpenAI usage shape.
+    
+    Args:
+        usage: Bedrock usage dictionary (inputTokens, outputTokens, totalTokens)
+    
+    Returns:
+        Dictionary with prompt_tokens, completion_tokens and total_tokens
+    """
+    return {
+        'prompt_tokens': usage.get('inputTokens', 0),
+        'completion_tokens': usage.get('outputTokens', 0),
+        'total_tokens': usage.get('totalTokens', 0)
+    }
+
+
+def _tool_start_chunk(index: int, tool_id: str, name: str) -> Dict[str, Any]:
+    """Build an OpenAI-style streaming chunk announcing a new tool call.
+    
+    Args:
+        index: Index of the tool call within the response
+        tool_id: Bedrock toolUseId for the call
+        name: Name of the tool being called
+    
+    Returns:
+        Chunk with a single tool_calls delta carrying id, name and empty arguments
+    """
+    return {'choices': [{'delta': {'tool_calls': [{
+        'index': index,
+        'id': tool_id,
+        'type': 'function',
+        'function': {'name': name, 'arguments': ''}
+    }]}}]}
+
+
+def _tool_arguments_chunk(index: int, arguments: str) -> Dict[str, Any]:
+    """Build an OpenAI-style streaming chunk carrying a tool-call arguments delta.
+    
+    Args:
+        index: Index of the tool call the fragment belongs to
+        arguments: JSON argument fragment to emit
+    
+    Returns:
+        Chunk with a single tool_calls delta for the given index
+    """
+    return {'choices': [{'delta': {'tool_calls': [{'index': index, 'function': {'arguments': arguments}}]}}]}
+
+
+@dataclass(frozen=True, slots=True)
+class BedrockResponse:
+    """Parsed, immutable result of a Bedrock Converse API call.
+    
+    Attributes:
+        content: Text content from the assistant (empty string if tool use only)
+        role: Role of the responder, always "assistant"
+        stop_reason: Reason the model stopped generating
+        usage: Token usage statistics as returned by Bedrock
+        tool_calls: Tool calls in OpenAI format (empty if none were requested)
+    """
+    content: str
+    role: str
+    stop_reason: str
+    usage: Dict[str, Any]
+    tool_calls: Tuple[Dict[str, Any], ...] = field(default=())
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the dictionary format returned by ShelloBedrockClient.chat().
+        
+        Returns:
+            Dictionary with content, role, stopReason, usage and, when present,
+            toolCalls keys
+        """
+        result: Dict[str, Any] = {
+            'content': self.content,
+            'role': self.role,
+            'stopReason': self.stop_reason,
+            'usage': self.usage
+        }
+        if self.tool_calls:
+            result['toolCalls'] = list(self.tool_calls)
+        return result
+
+
 class ShelloBedrockClient:
     """AWS Bedrock client for chat completions with tool support.
     
@@ -23,8 +307,12 @@ class ShelloBedrockClient:
         _model: The current model being used for completions
         _region: AWS region for the Bedrock service
         _debug: Enable detailed request/response logging
+        _last_usage: Token usage reported by the most recent request, if any
+        _tools_cache: Converted toolConfig dictionaries keyed by tool object identities
     """
     
+    __slots__ = ('_client', '_model', '_region', '_debug', '_last_usage', '_tools_cache')
+    
     def __init__(
         self,
         model: str = "anthropic.claude-3-sonnet-20240229-v1:0",
@@ -58,6 +346,10 @@ class ShelloBedrockClient:
         self._model = model
         self._region = region
         self._debug = debug
+        self._last_usage: Optional[Dict[str, Any]] = None
+        self._tools_cache: Dict[tuple, tuple] = {}
+        # Kept out of the OpenAI-format tool calls, which go into the shared
+        # conversation history as-is
         
         # Initialize boto3 client with appropriate authentication method
         self._client = self._create_client(
@@ -99,40 +391,10 @@ class ShelloBedrockClient:
         Raises:
             ClientError: If authentication fails or region is invalid
         """
-        # Configure boto3 client settings
-        config = Config(
-            region_name=region,
-            user_agent_extra='shello-cli/1.0',
-            read_timeout=300  # Important for streaming responses
+        # Clients with the same connection settings share one boto3 client
+        return _get_runtime_client(
+            region, access_key, secret_key, session_token, profile, endpoint_url
         )
-        
-        # Method 1: Use AWS profile
-        if profile:
-            session = boto3.Session(profile_name=profile)
-            return session.client(
-                service_name='bedrock-runtime',
-                config=config,
-                endpoint_url=endpoint_url
-            )
-        
-        # Method 2: Use explicit credentials
-        elif access_key and secret_key:
-            return boto3.client(
-                service_name='bedrock-runtime',
-                aws_access_key_id=access_key,
-                aws_secret_access_key=secret_key,
-                aws_session_token=session_token,
-                config=config,
-                endpoint_url=endpoint_url
-            )
-        
-        # Method 3: Use default AWS credential chain
-        else:
-            return boto3.client(
-                service_name='bedrock-runtime',
-                config=config,
-                endpoint_url=endpoint_url
-            )
     
     def set_model(self, model: str) -> None:
         """Change the current model used for completions.
@@ -151,6 +413,15 @@ class ShelloBedrockClient:
         """
         return self._model
     
+    def get_last_usage(self) -> Optional[Dict[str, Any]]:
+        """Get token usage reported by the most recent chat or chat_stream call.
+        
+        Returns:
+            Bedrock usage dictionary (inputTokens, outputTokens, totalTokens),
+            or None if no request has reported usage yet
+        """
+        return self._last_usage
+    
     def _format_messages(
         self,
         messages: List[Dict[str, Any]]
@@ -159,7 +430,7 @@ class ShelloBedrockClient:
         
         This method transforms messages from the OpenAI format used internally
         to the Bedrock Converse API format. It handles:
-        - Extracting system messages into a separate list
+        - Extracting system messages into a single system content block
         - Mapping user/assistant roles
         - Wrapping string content in text content blocks
         - Converting tool calls and tool results
@@ -170,7 +441,8 @@ class ShelloBedrockClient:
         Returns:
             Tuple of (bedrock_messages, system_prompts) where:
             - bedrock_messages: List of user/assistant messages in Bedrock format
-            - system_prompts: List of system message content blocks or None
+            - system_prompts: Single-element list holding the joined system
+              messages, or None if there were none
         
         Example:
             Input: [
@@ -183,7 +455,7 @@ class ShelloBedrockClient:
             )
         """
         bedrock_messages = []
-        system_prompts = []
+        system_parts: List[str] = []
         
         # Group consecutive tool result messages so they land in a single user message.
         # Bedrock requires ALL toolResult blocks that correspond to a single assistant
@@ -197,13 +469,14 @@ class ShelloBedrockClient:
             # Extract system messages separately
             if role == "system":
                 if isinstance(content, str) and content:
-                    system_prompts.append({"text": content})
+                    system_parts.append(content)
                 i += 1
                 continue
 
-            # Handle user and assistant messages
-            if role in ["user", "assistant"]:
-                bedrock_msg = self._convert_message(msg)
+            # Handle user and assistant messages via the role dispatch table
+            handler = self._ROLE_HANDLERS.get(role)
+            if handler is not None:
+                bedrock_msg = handler(self, msg)
                 if bedrock_msg:
                     bedrock_messages.append(bedrock_msg)
                 i += 1
@@ -225,8 +498,10 @@ class ShelloBedrockClient:
             else:
                 i += 1
         
-        # Return system prompts as None if empty
-        return bedrock_messages, system_prompts if system_prompts else None
+        # Merge all system messages into a single text block (None if empty)
+        if not system_parts:
+            return bedrock_messages, None
+        return bedrock_messages, [{"text": "\n\n".join(system_parts)}]
     
     def _convert_message(self, msg: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Convert a single user or assistant message to Bedrock format.
@@ -264,6 +539,13 @@ class ShelloBedrockClient:
         
         return None
     
+    # Per-message converters keyed by OpenAI role. Tool results are not listed
+    # here because consecutive tool messages are grouped in _format_messages.
+    _ROLE_HANDLERS = {
+        "user": _convert_message,
+        "assistant": _convert_message,
+    }
+    
     def _convert_tool_result_block(self, msg: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Convert a single tool result message to a Bedrock toolResult content block.
         
@@ -283,10 +565,14 @@ class ShelloBedrockClient:
         if not tool_call_id:
             return None
         
+        # Tool executor results are almost always plain str; exact-type check
+        # avoids the isinstance MRO walk for that common case
+        text = content if content.__class__ is str else str(content)
+        
         return {
             "toolResult": {
                 "toolUseId": tool_call_id,
-                "content": [{"text": content if isinstance(content, str) else str(content)}]
+                "content": [{"text": text}]
             }
         }
     
@@ -299,16 +585,15 @@ class ShelloBedrockClient:
         Returns:
             Bedrock toolUse content block or None if invalid
         """
-        import json
-        
         tool_id = tool_call.get("id", "")
         function = tool_call.get("function", {})
         function_name = function.get("name", "")
-        arguments_str = function.get("arguments", "{}")
         
         if not tool_id or not function_name:
             return None
         
+        arguments_str = function.get("arguments", "{}")
+        
         # Parse arguments from JSON string to dict
         try:
             arguments = json.loads(arguments_str) if isinstance(arguments_str, str) else arguments_str
@@ -401,6 +686,30 @@ class ShelloBedrockClient:
             "toolChoice": {"auto": {}}
         }
     
+    def _get_tool_config(self, tools: List[Any]) -> Dict[str, Any]:
+        """Return the Bedrock toolConfig for tools, reusing prior conversions.
+        
+        The agent sends the same tool schemas on every turn, so the result of
+        _format_tools is cached by the identities of the tool objects. The
+        cache entry holds references to those objects, which keeps the ids
+        valid while cached. The oldest entry is evicted once _TOOLS_CACHE_SIZE
+        is reached.
+        
+        Args:
+            tools: List of ShelloTool objects or tool dictionaries
+        
+        Returns:
+            Dictionary with 'tools' list and 'toolChoice' configuration
+        """
+        key = tuple(map(id, tools))
+        cached = self._tools_cache.get(key)
+        if cached is None:
+            if len(self._tools_cache) >= _TOOLS_CACHE_SIZE:
+                del self._tools_cache[next(iter(self._tools_cache))]
+            cached = (tuple(tools), self._format_tools(tools))
+            self._tools_cache[key] = cached
+        return cached[1]
+    
     def chat(
         self,
         messages: List[Dict[str, Any]],
@@ -442,6 +751,9 @@ class ShelloBedrockClient:
             >>> print(response['content'])
             "2 + 2 equals 4."
         """
+        # Read the debug flag once; all debug-only work is skipped when off
+        debug = self._debug
+        
         # Format messages for Bedrock (extracts system messages)
         bedrock_messages, system_prompts = self._format_messages(messages)
         
@@ -457,8 +769,7 @@ class ShelloBedrockClient:
         
         # Add tools if provided
         if tools:
-            tool_config = self._format_tools(tools)
-            request_params['toolConfig'] = tool_config
+            request_params['toolConfig'] = self._get_tool_config(tools)
         
         # Add default inference configuration
         request_params['inferenceConfig'] = {
@@ -467,84 +778,31 @@ class ShelloBedrockClient:
         }
         
         # Log request if debug is enabled
-        if self._debug:
-            self._log_request(self._model, bedrock_messages, tool_config if tools else None)
+        if debug:
+            self._log_request(self._model, bedrock_messages, request_params.get('toolConfig'))
         
         try:
-            # Call the Bedrock Converse API
-            response = self._client.converse(**request_params)
+            # Call the Bedrock Converse API (retrying transient errors)
+            response = self._converse_with_retry(request_params)
             
-            # Parse and return the response
+            # Parse the response
             parsed_response = self._parse_response(response)
+            self._last_usage = parsed_response.usage
             
             # Log response if debug is enabled
-            if self._debug:
+            if debug:
                 self._log_response(parsed_response)
             
-            return parsed_response
+            return parsed_response.to_dict()
         
         except ClientError as e:
             # Extract error details
             error_code = e.response.get('Error', {}).get('Code', 'Unknown')
             error_message = e.response.get('Error', {}).get('Message', str(e))
             
-            # Handle specific AWS Bedrock error types
-            if error_code == 'ValidationException':
-                # Check if this is a context window error
-                if 'too long' in error_message.lower() or 'context' in error_message.lower() or 'token' in error_message.lower():
-                    raise Exception(
-                        f"Bedrock API error: ValidationException - Context window exceeded. "
-                        f"The input is too long for the model's context window. "
-                        f"Please reduce the message history or input size. "
-                        f"Details: {error_message}"
-                    ) from e
-                else:
-                    raise Exception(
-                        f"Bedrock API error: ValidationException - Invalid request parameters. "
-                        f"Details: {error_message}"
-                    ) from e
-            
-            elif error_code == 'ThrottlingException':
-                raise Exception(
-                    f"Bedrock API error: ThrottlingException - Rate limit exceeded. "
-                    f"Too many requests have been made. Please wait and retry. "
-                    f"Details: {error_message}"
-                ) from e
-            
-            elif error_code == 'AccessDeniedException':
-                raise Exception(
-                    f"Bedrock API error: AccessDeniedException - Access denied. "
-                    f"Check your AWS credentials and IAM permissions for Bedrock. "
-                    f"Required permissions: bedrock:InvokeModel. "
-                    f"Details: {error_message}"
-                ) from e
-            
-            elif error_code == 'ModelNotReadyException':
-                raise Exception(
-                    f"Bedrock API error: ModelNotReadyException - Model is not ready. "
-                    f"The model is still loading. Please wait a moment and retry. "
-                    f"Details: {error_message}"
-                ) from e
-            
-            elif error_code == 'ResourceNotFoundException':
-                raise Exception(
-                    f"Bedrock API error: ResourceNotFoundException - Model not found. "
-                    f"The specified model '{self._model}' does not exist or is not available in region '{self._region}'. "
-                    f"Details: {error_message}"
-                ) from e
-            
-            elif error_code == 'ModelTimeoutException':
-                raise Exception(
-                    f"Bedrock API error: ModelTimeoutException - Model timeout. "
-                    f"The model took too long to respond. Try reducing the input size or retry. "
-                    f"Details: {error_message}"
-                ) from e
-            
-            else:
-                # Unknown error - wrap with descriptive message
-                raise Exception(
-                    f"Bedrock API error: {error_code} - {error_message}"
-                ) from e
+            raise Exception(
+                f"Bedrock API error: {self._describe_client_error(error_code, error_message)}"
+            ) from e
         
         except Exception as e:
             # Handle any other unexpected errors
@@ -554,7 +812,78 @@ class ShelloBedrockClient:
             else:
                 raise Exception(f"Bedrock API error: Unexpected error - {str(e)}") from e
     
-    def _parse_response(self, response: Dict[str, Any]) -> Dict[str, Any]:
+    def _converse_with_retry(self, request_params: Dict[str, Any]) -> Dict[str, Any]:
+        """Call the Converse API, retrying transient errors with backoff.
+        
+        Retryable errors are retried up to _MAX_CONVERSE_ATTEMPTS times with
+        exponential backoff (0.5s, 1s, 2s, ... capped at 30s) plus jitter.
+        
+        Args:
+            request_params: Keyword arguments for the converse() call
+        
+        Returns:
+            Raw Converse API response
+        
+        Raises:
+            ClientError: If the error is not retryable or attempts are exhausted
+        """
+        for attempt in range(_MAX_CONVERSE_ATTEMPTS):
+            try:
+                return self._client.converse(**request_params)
+            except ClientError as e:
+                error_code = e.response.get('Error', {}).get('Code', 'Unknown')
+                if error_code not in _RETRYABLE_ERROR_CODES or attempt == _MAX_CONVERSE_ATTEMPTS - 1:
+                    raise
+                time.sleep(min(30.0, 0.5 * 2 ** attempt) + random.random() * 0.1)
+    
+    async def chat_async(
+        self,
+        messages: List[Dict[str, Any]],
+        tools: Optional[List[Any]] = None
+    ) -> Dict[str, Any]:
+        """Async variant of chat() for issuing several requests concurrently.
+        
+        The blocking Converse call runs in a worker thread so callers can
+        await multiple requests (e.g. with anyio task groups or asyncio.gather)
+        and have them share this client's connection pool. boto3 clients are
+        thread-safe, so no additional client is created.
+        
+        Args:
+            messages: List of message dictionaries in OpenAI format with role and content
+            tools: Optional list of ShelloTool objects or tool dictionaries for function calling
+        
+        Returns:
+            Same dictionary as chat()
+        
+        Raises:
+            Exception: If the Bedrock API call fails, with descriptive error message
+        """
+        import anyio.to_thread
+        
+        return await anyio.to_thread.run_sync(self.chat, messages, tools)
+    
+    def _describe_client_error(self, error_code: str, error_message: str) -> str:
+        """Build a descriptive error text for a Bedrock ClientError.
+        
+        Args:
+            error_code: AWS error code (e.g., "ThrottlingException")
+            error_message: AWS error message
+        
+        Returns:
+            Error text of the form "<code> - <explanation>. Details: <message>"
+        """
+        if error_code == 'ValidationException' and _CONTEXT_ERROR_RE.search(error_message):
+            template = _CONTEXT_WINDOW_TEMPLATE
+        else:
+            template = _ERROR_TEMPLATES.get(error_code)
+        
+        if template is None:
+            # Unknown error - wrap with descriptive message
+            return f"{error_code} - {error_message}"
+        
+        return template.format(message=error_message, model=self._model, region=self._region)
+    
+    def _parse_response(self, response: Dict[str, Any]) -> BedrockResponse:
         """Parse Bedrock Converse API response to standard format.
         
         This method transforms the Bedrock response format into a consistent format
@@ -564,12 +893,8 @@ class ShelloBedrockClient:
             response: Raw response dictionary from Bedrock Converse API
         
         Returns:
-            Dictionary with standardized response format containing:
-            - content: Text content from the assistant (empty string if tool use)
-            - role: Always "assistant"
-            - stopReason: Reason the model stopped generating
-            - usage: Token usage statistics
-            - toolCalls: List of tool calls if stopReason is "tool_use" (optional)
+            Immutable BedrockResponse; use to_dict() for the dictionary format with
+            content, role, stopReason, usage and optional toolCalls keys
         
         Example Bedrock Response:
             {
@@ -588,19 +913,14 @@ class ShelloBedrockClient:
             }
         
         Example Parsed Response:
-            {
-                'content': 'Hello!',
-                'role': 'assistant',
-                'stopReason': 'end_turn',
-                'usage': {
-                    'inputTokens': 10,
-                    'outputTokens': 5,
-                    'totalTokens': 15
-                }
-            }
+            BedrockResponse(
+                content='Hello!',
+                role='assistant',
+                stop_reason='end_turn',
+                usage={'inputTokens': 10, 'outputTokens': 5, 'totalTokens': 15},
+                tool_calls=()
+            )
         """
-        import json
-        
         # Extract the message from the response
         output_message = response.get('output', {}).get('message', {})
         content_blocks = output_message.get('content', [])
@@ -608,14 +928,6 @@ class ShelloBedrockClient:
         stop_reason = response.get('stopReason', 'end_turn')
         usage = response.get('usage', {})
         
-        # Initialize result
-        result: Dict[str, Any] = {
-            'content': '',
-            'role': role,
-            'stopReason': stop_reason,
-            'usage': usage
-        }
-        
         # Extract content and tool calls from content blocks
         tool_calls = []
         text_parts = []
@@ -638,14 +950,13 @@ class ShelloBedrockClient:
                 }
                 tool_calls.append(tool_call)
         
-        # Combine text parts
-        result['content'] = ''.join(text_parts)
-        
-        # Add tool calls if present
-        if tool_calls:
-            result['toolCalls'] = tool_calls
-        
-        return result
+        return BedrockResponse(
+            content=''.join(text_parts),
+            role=role,
+            stop_reason=stop_reason,
+            usage=usage,
+            tool_calls=tuple(tool_calls)
+        )
     
     def _log_request(
         self,
@@ -662,10 +973,10 @@ class ShelloBedrockClient:
             model: The model identifier being used
             messages: List of messages in Bedrock format (after conversion)
             tools: Optional list of tools in Bedrock format (after conversion)
-        """
-        if not self._debug:
-            return
         
+        Callers check self._debug before calling, so no work is done here
+        when debug logging is off.
+        """
         print("\n" + "="*80)
         print("🔵 BEDROCK API REQUEST")
         print("="*80)
@@ -725,13 +1036,12 @@ class ShelloBedrockClient:
                     print(f"      Input:")
                     
                     # Pretty print the input
-                    import json
                     try:
                         input_obj = tool_use.get('input', {})
                         input_str = json.dumps(input_obj, indent=8)
                         for line in input_str.split('\n'):
                             print(f"      {line}")
-                    except:
+                    except (TypeError, ValueError):
                         print(f"        {tool_use.get('input', {})}")
             
             # Show TOOL RESULTS (if present)
@@ -770,7 +1080,7 @@ class ShelloBedrockClient:
     
     def _log_response(
         self,
-        response: Dict[str, Any]
+        response: BedrockResponse
     ) -> None:
         """Log response details for debugging.
         
@@ -778,59 +1088,63 @@ class ShelloBedrockClient:
         The output format is similar to the OpenAI client for consistency.
         
         Args:
-            response: The parsed response dictionary from Bedrock
-        """
-        if not self._debug:
-            return
+            response: The parsed response from Bedrock
         
-        print("\n" + "="*80)
-        print("🟢 BEDROCK API RESPONSE")
-        print("="*80)
-        print(f"Status: Success")
-        print(f"Model: {self._model}")
+        Callers check self._debug before calling, so no work is done here
+        when debug logging is off.
+        """
+        # Collect the report and write it with a single print call
+        lines = [
+            "\n" + "="*80,
+            "🟢 BEDROCK API RESPONSE",
+            "="*80,
+            "Status: Success",
+            f"Model: {self._model}",
+        ]
         
         # Show usage statistics
-        usage = response.get('usage', {})
+        usage = response.usage
         if usage:
-            print(f"Usage:")
-            print(f"  Input tokens: {usage.get('inputTokens', 0)}")
-            print(f"  Output tokens: {usage.get('outputTokens', 0)}")
-            print(f"  Total tokens: {usage.get('totalTokens', 0)}")
+            lines.append("Usage:")
+            lines.append(f"  Input tokens: {usage.get('inputTokens', 0)}")
+            lines.append(f"  Output tokens: {usage.get('outputTokens', 0)}")
+            lines.append(f"  Total tokens: {usage.get('totalTokens', 0)}")
         
         # Show stop reason
-        stop_reason = response.get('stopReason', 'unknown')
-        print(f"\nStop Reason: {stop_reason}")
+        stop_reason = response.stop_reason or 'unknown'
+        lines.append(f"\nStop Reason: {stop_reason}")
         
         # Check if both content and tool_calls are present
-        content = response.get('content', '')
-        tool_calls = response.get('toolCalls', [])
-        has_content = content and isinstance(content, str)
-        has_tool_calls = tool_calls and len(tool_calls) > 0
+        content = response.content
+        tool_calls = response.tool_calls
+        has_content = isinstance(content, str) and content
         
-        if has_content and has_tool_calls:
-            print(f"✨ BOTH content AND tool_calls present!")
+        if has_content and tool_calls:
+            lines.append("✨ BOTH content AND tool_calls present!")
         
         # Show content preview
         if has_content:
             preview = content[:100].replace('\n', ' ')
             if len(content) > 100:
                 preview += "..."
-            print(f"Content: {preview}")
+            lines.append(f"Content: {preview}")
         
         # Show tool calls if present
-        if has_tool_calls:
-            print(f"\nTool Calls: {len(tool_calls)}")
+        if tool_calls:
+            lines.append(f"\nTool Calls: {len(tool_calls)}")
             for tc in tool_calls:
                 func = tc.get('function', {})
-                print(f"  - {func.get('name', 'unknown')}")
-                print(f"    ID: {tc.get('id', 'unknown')}")
+                lines.append(f"  - {func.get('name', 'unknown')}")
+                lines.append(f"    ID: {tc.get('id', 'unknown')}")
         
-        print("="*80 + "\n")
+        lines.append("="*80 + "\n")
+        print("\n".join(lines))
     
     def chat_stream(
         self,
         messages: List[Dict[str, Any]],
-        tools: Optional[List[Any]] = None
+        tools: Optional[List[Any]] = None,
+        coalesce_ms: float = 0.0
     ) -> Generator[Dict[str, Any], None, None]:
         """Stream chat completion response chunks as they arrive.
         
@@ -845,12 +1159,19 @@ class ShelloBedrockClient:
             messages: List of message dictionaries in OpenAI format with role and content.
                      System messages are automatically extracted and passed separately.
             tools: Optional list of ShelloTool objects or tool dictionaries for function calling
+            coalesce_ms: When > 0, merge consecutive text deltas and yield them at most
+                        once per this many milliseconds (or once _COALESCE_MAX_CHARS
+                        characters are buffered). Buffered text is always flushed
+                        before any non-text chunk and at the end of the stream.
+                        Default 0 yields every delta as it arrives.
         
         Yields:
             Dictionary chunks in OpenAI-compatible format with the following structure:
             - Text chunks: {"choices": [{"delta": {"content": "text"}}]}
             - Tool use chunks: {"choices": [{"delta": {"tool_calls": [...]}}]}
             - Finish chunks: {"choices": [{"finish_reason": "stop"}]}
+            - Usage chunk (last): {"choices": [], "usage": {"prompt_tokens": ...,
+              "completion_tokens": ..., "total_tokens": ...}, "metrics": {...}}
             
             Stream event types from Bedrock:
             - contentBlockDelta: Contains text or tool input deltas
@@ -871,7 +1192,8 @@ class ShelloBedrockClient:
             ...             print(delta["content"], end="", flush=True)
             1, 2, 3
         """
-        import json
+        # Read the debug flag once; all debug-only work is skipped when off
+        debug = self._debug
         
         # Format messages for Bedrock (extracts system messages)
         bedrock_messages, system_prompts = self._format_messages(messages)
@@ -888,8 +1210,7 @@ class ShelloBedrockClient:
         
         # Add tools if provided
         if tools:
-            tool_config = self._format_tools(tools)
-            request_params['toolConfig'] = tool_config
+            request_params['toolConfig'] = self._get_tool_config(tools)
         
         # Add default inference configuration
         request_params['inferenceConfig'] = {
@@ -898,120 +1219,90 @@ class ShelloBedrockClient:
         }
         
         # Log request if debug is enabled
-        if self._debug:
-            self._log_request(self._model, bedrock_messages, tool_config if tools else None)
+        if debug:
+            self._log_request(self._model, bedrock_messages, request_params.get('toolConfig'))
             print("🔵 BEDROCK API REQUEST (STREAMING)")
             print("Note: Response chunks will be processed by the stream iterator")
             print("="*80 + "\n")
         
+        # Text coalescing state (only used when coalesce_ms > 0)
+        coalesce = coalesce_ms > 0
+        flush_interval = coalesce_ms / 1000.0
+        text_buffer: List[str] = []
+        buffered_chars = 0
+        last_flush = time.monotonic()
+        
         try:
             # Call the Bedrock ConverseStream API
             response = self._client.converse_stream(**request_params)
             
-            # Track tool calls being accumulated
-            tool_call_accumulator: Dict[int, Dict[str, Any]] = {}
+            # Index of the tool call currently being streamed
             current_tool_index = -1
             received_message_stop = False  # Track if we received a proper messageStop event
             
             # Process the stream events
-            for event in response.get('stream', []):
-                # Handle contentBlockStart - signals start of a content block (text or tool use)
-                if 'contentBlockStart' in event:
-                    block_start = event['contentBlockStart']
-                    start_data = block_start.get('start', {})
-                    
-                    # Check if this is a tool use block
-                    if 'toolUse' in start_data:
-                        tool_use = start_data['toolUse']
-                        current_tool_index += 1
-                        
-                        # Initialize tool call accumulator
-                        tool_call_accumulator[current_tool_index] = {
-                            'id': tool_use.get('toolUseId', ''),
-                            'type': 'function',
-                            'function': {
-                                'name': tool_use.get('name', ''),
-                                'arguments': ''
-                            }
-                        }
-                        
-                        # Yield initial tool call chunk with id and name
-                        yield {
-                            'choices': [{
-                                'delta': {
-                                    'tool_calls': [{
-                                        'index': current_tool_index,
-                                        'id': tool_use.get('toolUseId', ''),
-                                        'type': 'function',
-                                        'function': {
-                                            'name': tool_use.get('name', ''),
-                                            'arguments': ''
-                                        }
-                                    }]
-                                }
-                            }]
-                        }
+            for event in response.get('stream') or ():
+                # Bedrock stream events are single-key dicts; dispatch on that key,
+                # checking the most frequent event (contentBlockDelta) first
+                key = next(iter(event), '')
+                
+                # Any event other than a delta ends the current run of text
+                if text_buffer and key != 'contentBlockDelta':
+                    yield _text_chunk(''.join(text_buffer))
+                    text_buffer.clear()
+                    buffered_chars = 0
                 
                 # Handle contentBlockDelta - contains text or tool input chunks
-                elif 'contentBlockDelta' in event:
-                    delta = event['contentBlockDelta'].get('delta', {})
+                if key == 'contentBlockDelta':
+                    delta = event['contentBlockDelta'].get('delta', _EMPTY)
                     
                     # Handle text delta
                     if 'text' in delta:
-                        text_chunk = delta['text']
-                        yield {
-                            'choices': [{
-                                'delta': {
-                                    'content': text_chunk
-                                }
-                            }]
-                        }
+                        if not coalesce:
+                            yield _text_chunk(delta['text'])
+                        else:
+                            text = delta['text']
+                            text_buffer.append(text)
+                            buffered_chars += len(text)
+                            now = time.monotonic()
+                            if buffered_chars >= _COALESCE_MAX_CHARS or now - last_flush >= flush_interval:
+                                yield _text_chunk(''.join(text_buffer))
+                                text_buffer.clear()
+                                buffered_chars = 0
+                                last_flush = now
                     
                     # Handle tool use input delta
                     elif 'toolUse' in delta:
                         tool_use_delta = delta['toolUse']
                         input_chunk = tool_use_delta.get('input', '')
                         
-                        # Accumulate the input
-                        if current_tool_index >= 0 and current_tool_index in tool_call_accumulator:
-                            tool_call_accumulator[current_tool_index]['function']['arguments'] += input_chunk
-                            
-                            # Yield tool call delta with arguments
-                            yield {
-                                'choices': [{
-                                    'delta': {
-                                        'tool_calls': [{
-                                            'index': current_tool_index,
-                                            'function': {
-                                                'arguments': input_chunk
-                                            }
-                                        }]
-                                    }
-                                }]
-                            }
+                        # Yield tool call delta with arguments; the consumer
+                        # assembles the full input from these fragments
+                        if current_tool_index >= 0:
+                            yield _tool_arguments_chunk(current_tool_index, input_chunk)
                 
-                # Handle metadata - contains token usage
-                elif 'metadata' in event:
-                    usage = event['metadata'].get('usage', {})
-                    # Store usage for potential later use, but don't yield yet
-                    # The message processor doesn't expect usage in streaming chunks
-                    pass
+                # Handle contentBlockStart - signals start of a content block (text or tool use)
+                elif key == 'contentBlockStart':
+                    block_start = event['contentBlockStart']
+                    start_data = block_start.get('start', _EMPTY)
+                    
+                    # Check if this is a tool use block
+                    if 'toolUse' in start_data:
+                        tool_use = start_data['toolUse']
+                        tool_id = tool_use.get('toolUseId', '')
+                        name = tool_use.get('name', '')
+                        current_tool_index += 1
+                        
+                        # Yield initial tool call chunk with id and name
+                        yield _tool_start_chunk(current_tool_index, tool_id, name)
                 
                 # Handle messageStop - signals end of message
-                elif 'messageStop' in event:
+                elif key == 'messageStop':
                     stop_reason = event['messageStop'].get('stopReason', 'end_turn')
                     received_message_stop = True  # Mark that we received a proper stop signal
                     
                     # Map Bedrock stop reasons to OpenAI finish reasons
-                    finish_reason_map = {
-                        'end_turn': 'stop',
-                        'max_tokens': 'length',
-                        'stop_sequence': 'stop',
-                        'tool_use': 'tool_calls',
-                        'content_filtered': 'content_filter'
-                    }
-                    
-                    finish_reason = finish_reason_map.get(stop_reason, 'stop')
+                    finish_reason = _FINISH_REASON_MAP.get(stop_reason, 'stop')
                     
                     # Yield finish chunk
                     yield {
@@ -1020,6 +1311,27 @@ class ShelloBedrockClient:
                             'delta': {}
                         }]
                     }
+                
+                # Handle metadata - contains token usage
+                elif key == 'metadata':
+                    metadata = event['metadata']
+                    usage = metadata.get('usage', {})
+                    self._last_usage = usage
+                    
+                    # Yield usage chunk (empty choices, like OpenAI's include_usage
+                    # chunk) so consumers can track cost; the message processor
+                    # skips chunks without choices. Bedrock sends metadata after
+                    # messageStop, so this is the final chunk of the stream.
+                    yield {
+                        'choices': [],
+                        'usage': _openai_usage(usage),
+                        'metrics': metadata.get('metrics', {})
+                    }
+            
+            # Flush text still buffered when the stream ends
+            if text_buffer:
+                yield _text_chunk(''.join(text_buffer))
+                text_buffer.clear()
             
             # If we didn't receive a messageStop event, yield a default finish chunk
             # This handles cases where the stream ends without a proper stop signal
@@ -1036,72 +1348,14 @@ class ShelloBedrockClient:
             error_code = e.response.get('Error', {}).get('Code', 'Unknown')
             error_message = e.response.get('Error', {}).get('Message', str(e))
             
-            # Handle specific AWS Bedrock error types
-            error_text = ""
-            
-            if error_code == 'ValidationException':
-                # Check if this is a context window error
-                if 'too long' in error_message.lower() or 'context' in error_message.lower() or 'token' in error_message.lower():
-                    error_text = (
-                        f"ValidationException - Context window exceeded. "
-                        f"The input is too long for the model's context window. "
-                        f"Please reduce the message history or input size. "
-                        f"Details: {error_message}"
-                    )
-                else:
-                    error_text = (
-                        f"ValidationException - Invalid request parameters. "
-                        f"Details: {error_message}"
-                    )
-            
-            elif error_code == 'ThrottlingException':
-                error_text = (
-                    f"ThrottlingException - Rate limit exceeded. "
-                    f"Too many requests have been made. Please wait and retry. "
-                    f"Details: {error_message}"
-                )
-            
-            elif error_code == 'AccessDeniedException':
-                error_text = (
-                    f"AccessDeniedException - Access denied. "
-                    f"Check your AWS credentials and IAM permissions for Bedrock. "
-                    f"Required permissions: bedrock:InvokeModel. "
-                    f"Details: {error_message}"
-                )
+            error_text = self._describe_client_error(error_code, error_message)
             
-            elif error_code == 'ModelNotReadyException':
-                error_text = (
-                    f"ModelNotReadyException - Model is not ready. "
-                    f"The model is still loading. Please wait a moment and retry. "
-                    f"Details: {error_message}"
-                )
-            
-            elif error_code == 'ResourceNotFoundException':
-                error_text = (
-                    f"ResourceNotFoundException - Model not found. "
-                    f"The specified model '{self._model}' does not exist or is not available in region '{self._region}'. "
-                    f"Details: {error_message}"
-                )
-            
-            elif error_code == 'ModelTimeoutException':
-                error_text = (
-                    f"ModelTimeoutException - Model timeout. "
-                    f"The model took too long to respond. Try reducing the input size or retry. "
-                    f"Details: {error_message}"
-                )
-            
-            else:
-                # Unknown error - wrap with descriptive message
-                error_text = f"{error_code} - {error_message}"
+            # Deliver any text received before the failure, then the error
+            if text_buffer:
+                yield _text_chunk(''.join(text_buffer))
             
             # Yield error chunk in a format the message processor can handle
-            yield {
-                'choices': [{
-                    'delta': {
-                        'content': f"\n\nError: Bedrock API error: {error_text}\n"
-                    }
-                }]
-            }
+            yield _text_chunk(f"\n\nError: Bedrock API error: {error_text}\n")
             return
         
         except Exception as e:
@@ -1112,11 +1366,8 @@ class ShelloBedrockClient:
             if "Bedrock API error:" not in error_text:
                 error_text = f"Unexpected error - {error_text}"
             
-            yield {
-                'choices': [{
-                    'delta': {
-                        'content': f"\n\nError: {error_text}\n"
-                    }
-                }]
-            }
+            if text_buffer:
+                yield _text_chunk(''.join(text_buffer))
+            
+            yield _text_chunk(f"\n\nError: {error_text}\n")
             return
@@ -5,7 +5,9 @@ This module provides a factory function that creates the appropriate client
 in the settings manager.
 """
 
-from typing import Union, Optional, TYPE_CHECKING
+from typing import Any, Callable, Dict, Union, Optional, TYPE_CHECKING
+
+from shello_cli.api import DEBUG_OFF
 
 if TYPE_CHECKING:
     from shello_cli.settings import SettingsManager
@@ -44,18 +46,36 @@ def create_client(
     # Determine which provider to use
     target_provider = provider or settings_manager.get_provider()
     
-    if target_provider == "openai":
-        return _create_openai_client(settings_manager)
-    
-    elif target_provider == "bedrock":
-        return _create_bedrock_client(settings_manager)
-    
-    else:
+    factory = _PROVIDER_FACTORIES.get(target_provider)
+    if factory is None:
         raise ValueError(
             f"Unknown provider: '{target_provider}'. "
-            f"Supported providers: openai, bedrock. "
+            f"Supported providers: {', '.join(_PROVIDER_FACTORIES)}. "
             f"Run 'shello setup' to configure a valid provider."
         )
+    
+    return factory(settings_manager)
+
+
+def register_provider(
+    name: str,
+    factory: Callable[['SettingsManager'], Any]
+) -> None:
+    """Register a client factory for a provider name.
+    
+    The factory receives the settings manager and returns a client exposing
+    the same chat/chat_stream interface as ShelloClient. Registering an
+    existing name replaces its factory.
+    
+    Args:
+        name: Provider name as passed to create_client (e.g., "ollama")
+        factory: Callable that builds the client from a SettingsManager
+    
+    Examples:
+        >>> register_provider("custom", lambda settings: MyClient(settings))
+        >>> client = create_client(settings, provider="custom")
+    """
+    _PROVIDER_FACTORIES[name] = factory
 
 
 def _create_openai_client(settings_manager: 'SettingsManager') -> 'ShelloClient':
@@ -93,11 +113,12 @@ def _create_openai_client(settings_manager: 'SettingsManager') -> 'ShelloClient'
     base_url = config.get("base_url")
     model = config.get("model", "gpt-4o")
     
-    # Create and return the client
+    # Create and return the client, logging API traffic at the session's debug level
     return ShelloClient(
         api_key=api_key,
         model=model,
-        base_url=base_url if base_url else None
+        base_url=base_url if base_url else None,
+        debug_level=settings_manager.get_debug_level()
     )
 
 
@@ -141,11 +162,20 @@ def _create_bedrock_client(settings_manager: 'SettingsManager') -> 'ShelloBedroc
     secret_key = config.get("secret_key")
     model = config.get("model", "anthropic.claude-3-5-sonnet-20241022-v2:0")
     
-    # Create and return the client
+    # Create and return the client; it has a single debug level, so any
+    # session debug level turns its logging on
     return ShelloBedrockClient(
         model=model,
         region=region,
         aws_access_key=access_key,
         aws_secret_key=secret_key,
-        aws_profile=profile
+        aws_profile=profile,
+        debug=settings_manager.get_debug_level() > DEBUG_OFF
     )
+
+
+# Client factories by provider name, used by create_client
+_PROVIDER_FACTORIES: Dict[str, Callable[['SettingsManager'], Any]] = {
+    "openai": _create_openai_client,
+    "bedrock": _create_bedrock_client,
+}
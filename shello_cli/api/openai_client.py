@@ -6,11 +6,141 @@ supporting chat completions with tool calling and streaming responses.
 """
 
 import json
-from typing import List, Optional, Dict, Any, Generator
-from openai import OpenAI
-import httpx
+from typing import List, Optional, Dict, Any, Generator, TYPE_CHECKING
+from shello_cli.api import DEBUG_OFF, DEBUG_SUMMARY, DEBUG_FULL, DEBUG_VERBOSE
 from shello_cli.types import ShelloTool
 
+if TYPE_CHECKING:
+    import httpx
+
+
+# Keep-alive pool for API connections. Idle connections are kept for a minute
+# so consecutive turns of a conversation reuse the established TLS session.
+_HTTP_POOL_LIMITS = {
+    'max_connections': 16,
+    'max_keepalive_connections': 8,
+    'keepalive_expiry': 60.0,
+}
+
+# HTTP client shared by all non-debug ShelloClient instances
+_shared_http_client = None
+
+# Number of distinct tool lists whose converted form is kept per client
+_TOOLS_CACHE_SIZE = 4
+
+# Lines of each message body shown in a full request dump
+_MESSAGE_PREVIEW_LINES = 50
+
+# Rules framing the debug dumps and separating messages within a request dump
+_SEPARATOR = "=" * 80
+_MESSAGE_SEPARATOR = "  " + "─" * 76
+
+
+def _new_http_client(**kwargs: Any) -> 'httpx.Client':
+    """Create an httpx client with the OpenAI SDK defaults and our pool limits.
+    
+    Args:
+        **kwargs: Extra httpx.Client arguments (e.g., event_hooks)
+    
+    Returns:
+        httpx client suitable for passing to OpenAI(http_client=...)
+    """
+    import httpx
+    from openai import DefaultHttpxClient
+    
+    return DefaultHttpxClient(limits=httpx.Limits(**_HTTP_POOL_LIMITS), **kwargs)
+
+
+def _get_shared_http_client() -> 'httpx.Client':
+    """Return the process-wide HTTP client used by non-debug ShelloClients.
+    
+    Sharing one connection pool lets new clients (e.g. after /new or a
+    provider switch) reuse warm keep-alive connections instead of paying a
+    fresh TCP and TLS handshake. The pool is closed at interpreter exit.
+    
+    Returns:
+        Shared httpx client
+    """
+    global _shared_http_client
+    if _shared_http_client is None or _shared_http_client.is_closed:
+        import atexit
+        
+        _shared_http_client = _new_http_client()
+        atexit.register(_shared_http_client.close)
+    return _shared_http_client
+
+
+def _preview_lines(text: str, max_lines: int) -> tuple:
+    """Return the first max_lines lines of text and how many lines were left out.
+    
+    Only scans for the first max_lines newlines, so a large tool result is
+    sliced once instead of being split into a list of every line.
+    
+    Args:
+        text: Text to preview
+        max_lines: Maximum number of lines to keep
+    
+    Returns:
+        Tuple of (preview text, number of omitted lines)
+    """
+    end = -1
+    for _ in range(max_lines):
+        end = text.find('\n', end + 1)
+        if end < 0:
+            return text, 0
+    return text[:end], text.count('\n', end + 1) + 1
+
+
+def _chunk_to_dict(chunk: Any) -> Dict[str, Any]:
+    """Convert a streaming ChatCompletionChunk to the dict shape consumers read.
+    
+    Reads only the fields the message processor uses (choice deltas, tool call
+    fragments, finish reason and usage) via attribute access instead of a full
+    Pydantic model_dump() of every chunk. Keys mirror model_dump(), including
+    None values, so consumers see the same structure.
+    
+    Args:
+        chunk: ChatCompletionChunk from the OpenAI SDK stream
+    
+    Returns:
+        Dictionary with 'choices' (and 'usage' when the chunk reports it)
+    """
+    choices = []
+    for choice in chunk.choices:
+        delta = choice.delta
+        delta_dict: Dict[str, Any] = {}
+        if delta is not None:
+            tool_calls = None
+            if delta.tool_calls is not None:
+                tool_calls = []
+                for tool_call in delta.tool_calls:
+                    function = tool_call.function
+                    tool_calls.append({
+                        'index': tool_call.index,
+                        'id': tool_call.id,
+                        'type': tool_call.type,
+                        'function': None if function is None else {
+                            'name': function.name,
+                            'arguments': function.arguments
+                        }
+                    })
+            delta_dict = {
+                'role': delta.role,
+                'content': delta.content,
+                'tool_calls': tool_calls
+            }
+        choices.append({
+            'index': choice.index,
+            'delta': delta_dict,
+            'finish_reason': choice.finish_reason
+        })
+    
+    result: Dict[str, Any] = {'choices': choices}
+    usage = getattr(chunk, 'usage', None)
+    if usage is not None:
+        result['usage'] = usage.model_dump()
+    return result
+
 
 class ShelloClient:
     """OpenAI-compatible API client for chat completions with tool support.
@@ -21,9 +151,21 @@ class ShelloClient:
     Attributes:
         _client: The underlying OpenAI client instance
         _model: The current model being used for completions
+        _debug: Whether HTTP request/response logging hooks are installed
+        _debug_level: Logging verbosity of the hooks (see the DEBUG_* levels)
+        _tools_cache: Converted tool dictionaries keyed by tool object identities
     """
     
-    def __init__(self, api_key: str, model: str = "gpt-4o", base_url: Optional[str] = None, debug: bool = False):
+    __slots__ = ('_client', '_model', '_debug', '_debug_level', '_tools_cache')
+    
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "gpt-4o",
+        base_url: Optional[str] = None,
+        debug: bool = False,
+        debug_level: Optional[int] = None
+    ):
         """Initialize the Shello client with API credentials.
         
         Args:
@@ -31,6 +173,12 @@ class ShelloClient:
             model: Model name to use for completions (default: "gpt-4o")
             base_url: Optional custom base URL for OpenAI-compatible endpoints
             debug: Enable detailed HTTP request/response logging (default: False)
+            debug_level: Optional logging verbosity: DEBUG_OFF (0), DEBUG_SUMMARY (1,
+                        one line per request/response, no body parsing),
+                        DEBUG_FULL (2, streaming requests summarised in one line)
+                        or DEBUG_VERBOSE (3, everything dumped in full). Defaults to
+                        DEBUG_VERBOSE when debug is True.
+                        A non-zero level enables debug logging on its own.
         
         Raises:
             ValueError: If api_key is None or empty
@@ -38,41 +186,72 @@ class ShelloClient:
         if not api_key:
             raise ValueError("API key cannot be None or empty")
         
+        if debug_level is None:
+            debug_level = DEBUG_VERBOSE if debug else DEBUG_OFF
+        debug = debug_level > DEBUG_OFF
+        
         self._model = model
         self._debug = debug
+        self._debug_level = debug_level
+        self._tools_cache: Dict[tuple, tuple] = {}
+        
+        # Imported here so sessions using another provider never load the SDK
+        from openai import OpenAI
         
-        # Create HTTP client with logging hooks if debug is enabled
         if debug:
-            http_client = httpx.Client(
-                event_hooks={
-                    'request': [self._log_request],
-                    'response': [self._log_response]
-                }
-            )
-            
-            if base_url:
-                self._client = OpenAI(api_key=api_key, base_url=base_url, http_client=http_client)
-            else:
-                self._client = OpenAI(api_key=api_key, http_client=http_client)
+            http_client = self._new_debug_http_client()
+        else:
+            http_client = _get_shared_http_client()
+        
+        if base_url:
+            self._client = OpenAI(api_key=api_key, base_url=base_url, http_client=http_client)
         else:
-            # Initialize OpenAI client without logging
-            if base_url:
-                self._client = OpenAI(api_key=api_key, base_url=base_url)
-            else:
-                self._client = OpenAI(api_key=api_key)
+            self._client = OpenAI(api_key=api_key, http_client=http_client)
     
-    def _log_request(self, request: httpx.Request) -> None:
+    def set_debug_level(self, level: int) -> None:
+        """Change the verbosity of the debug logging hooks.
+        
+        Takes effect immediately. A client created without debug logging gets
+        the hooks on the first non-zero level: its SDK client is rebound to a
+        dedicated HTTP client, and the ShelloClient and its state are kept.
+        DEBUG_OFF silences the hooks, which then stay installed.
+        
+        Args:
+            level: DEBUG_OFF, DEBUG_SUMMARY, DEBUG_FULL or DEBUG_VERBOSE
+        """
+        if level > DEBUG_OFF and not self._debug:
+            self._client = self._client.with_options(http_client=self._new_debug_http_client())
+            self._debug = True
+        self._debug_level = level
+    
+    def _new_debug_http_client(self) -> 'httpx.Client':
+        """Create a dedicated HTTP client that runs this instance's logging hooks."""
+        return _new_http_client(event_hooks={
+            'request': [self._log_request],
+            'response': [self._log_response]
+        })
+    
+    def _log_request(self, request: 'httpx.Request') -> None:
         """Log HTTP request details for debugging.
         
         Args:
             request: The HTTP request object
         """
-        print("\n" + "="*80)
-        print("🔵 OPENAI API REQUEST")
-        print("="*80)
+        level = self._debug_level
+        if level <= DEBUG_OFF:
+            return
+        if level == DEBUG_SUMMARY:
+            # Size from the header only; the body is not parsed at this level
+            size = request.headers.get("content-length", "?")
+            print(f"🔵 OPENAI API REQUEST {request.method} {request.url} ({size} bytes)")
+            return
+        
+        # Collect the report and write it with a single print call
+        out = ["\n" + _SEPARATOR, "🔵 OPENAI API REQUEST", _SEPARATOR]
         
         try:
-            body = json.loads(request.content.decode('utf-8'))
+            # json.loads accepts the raw UTF-8 bytes; no separate decode step
+            body = json.loads(request.content)
             
             # Extract key information
             model = body.get('model', 'unknown')
@@ -80,9 +259,18 @@ class ShelloClient:
             tools = body.get('tools', [])
             stream = body.get('stream', False)
             
-            print(f"Model: {model}")
-            print(f"Stream: {stream}")
-            print(f"\n📨 Messages ({len(messages)}):")
+            # Streaming requests are sent every REPL turn; summarise them in
+            # one line unless verbose logging was asked for
+            if stream and level < DEBUG_VERBOSE:
+                print(
+                    f"🔵 OPENAI API REQUEST (stream) model={model} "
+                    f"messages={len(messages)} tools={len(tools)}"
+                )
+                return
+            
+            out.append(f"Model: {model}")
+            out.append(f"Stream: {stream}")
+            out.append(f"\n📨 Messages ({len(messages)}):")
             
             # Show full message content
             for i, msg in enumerate(messages, 1):
@@ -91,151 +279,166 @@ class ShelloClient:
                 tool_calls = msg.get('tool_calls', [])
                 tool_call_id = msg.get('tool_call_id', None)
                 
-                print(f"\n  [{i}] Role: {role.upper()}")
-                print(f"  {'─' * 76}")
+                out.append(f"\n  [{i}] Role: {role.upper()}")
+                out.append(_MESSAGE_SEPARATOR)
                 
                 # Show content FIRST (if present)
                 has_content = isinstance(content, str) and content
                 if has_content:
                     # For system messages, show only first line
                     if role.lower() == 'system':
-                        first_line = content.split('\n')[0]
-                        print(f"  {first_line}")
-                        print(f"  ... (system prompt truncated)")
+                        first_line = content.partition('\n')[0]
+                        out.append(f"  {first_line}")
+                        out.append(f"  ... (system prompt truncated)")
                     else:
                         # Show full content for user/assistant/tool messages
-                        lines = content.split('\n')
-                        for line in lines[:50]:  # Limit to first 50 lines per message
-                            print(f"  {line}")
-                        if len(lines) > 50:
-                            print(f"  ... ({len(lines) - 50} more lines)")
+                        # Limit to first 50 lines per message, indented in one replace
+                        preview, extra = _preview_lines(content, _MESSAGE_PREVIEW_LINES)
+                        out.append("  " + preview.replace("\n", "\n  "))
+                        if extra:
+                            out.append(f"  ... ({extra} more lines)")
                 
                 # Show tool calls AFTER content (if present)
                 if tool_calls:
                     # Add visual separator if there was content before
                     if has_content:
-                        print(f"\n  {'─' * 76}")
+                        out.append("\n" + _MESSAGE_SEPARATOR)
                     
-                    print(f"  🔧 Tool Calls: {len(tool_calls)}")
+                    out.append(f"  🔧 Tool Calls: {len(tool_calls)}")
                     for tc in tool_calls:
                         func = tc.get('function', {})
                         func_name = func.get('name', 'unknown')
                         func_args = func.get('arguments', '{}')
                         tc_id = tc.get('id', 'unknown')
                         
-                        print(f"\n    • Function: {func_name}")
-                        print(f"      Call ID: {tc_id}")
-                        print(f"      Arguments:")
+                        out.append(f"\n    • Function: {func_name}")
+                        out.append(f"      Call ID: {tc_id}")
+                        out.append(f"      Arguments:")
                         
-                        # Pretty print the arguments
+                        # Pretty print the arguments (raw text if they are not valid JSON)
                         try:
                             args_obj = json.loads(func_args)
-                            args_str = json.dumps(args_obj, indent=8)
-                            # Indent each line
-                            for line in args_str.split('\n'):
-                                print(f"      {line}")
-                        except:
-                            print(f"        {func_args}")
+                        except (ValueError, TypeError):
+                            out.append(f"        {func_args}")
+                        else:
+                            # Two-space JSON indent, shifted under the "Arguments:" label
+                            args_str = json.dumps(args_obj, indent=2)
+                            out.append("        " + args_str.replace("\n", "\n        "))
                 
                 # Show tool call ID if this is a tool result message
                 if tool_call_id:
-                    print(f"  🔧 Tool Result for Call ID: {tool_call_id}")
+                    out.append(f"  🔧 Tool Result for Call ID: {tool_call_id}")
                 
                 # Show status if neither content nor tool calls
                 if not has_content and not tool_calls and not tool_call_id:
-                    print(f"  <no content>")
+                    out.append(f"  <no content>")
                 elif not isinstance(content, str) and content is not None:
-                    print(f"  <complex content: {type(content).__name__}>")
+                    out.append(f"  <complex content: {type(content).__name__}>")
             
             # Show tools summary
             if tools:
-                print(f"\n🛠️  Tools ({len(tools)}):")
+                out.append(f"\n🛠️  Tools ({len(tools)}):")
                 for tool in tools:
                     func = tool.get('function', {})
                     name = func.get('name', 'unknown')
                     desc = func.get('description', 'No description')
-                    print(f"  • {name}")
+                    out.append(f"  • {name}")
                     # Show first line of description
                     desc_line = desc.split('\n')[0][:70]
-                    print(f"    {desc_line}")
+                    out.append(f"    {desc_line}")
             
         except Exception as e:
-            print(f"Body: <unable to parse: {e}>")
+            out.append(f"Body: <unable to parse: {e}>")
         
-        print("="*80 + "\n")
+        out.append(_SEPARATOR + "\n")
+        print("\n".join(out))
     
-    def _log_response(self, response: httpx.Response) -> None:
+    def _log_response(self, response: 'httpx.Response') -> None:
         """Log HTTP response details for debugging.
         
         Args:
             response: The HTTP response object
         """
-        print("\n" + "="*80)
-        print("🟢 OPENAI API RESPONSE")
-        print("="*80)
-        print(f"Status: {response.status_code} ({response.reason_phrase})")
+        level = self._debug_level
+        if level <= DEBUG_OFF:
+            return
+        if level == DEBUG_SUMMARY:
+            content_type = response.headers.get("content-type", "unknown")
+            print(f"🟢 OPENAI API RESPONSE {response.status_code} ({response.reason_phrase}) {content_type}")
+            return
+        
+        # Collect the report and write it with a single print call
+        out = [
+            "\n" + _SEPARATOR,
+            "🟢 OPENAI API RESPONSE",
+            _SEPARATOR,
+            f"Status: {response.status_code} ({response.reason_phrase})",
+        ]
         
-        # Only log body for non-streaming responses
-        # Streaming responses will be consumed by the iterator
+        # The body is not read here: chat() logs the parsed completion via
+        # _log_completion, and streaming bodies belong to the stream iterator
         if response.headers.get("content-type", "").startswith("text/event-stream"):
-            print(f"Type: Streaming response")
-            print(f"Note: Chunks will be processed by the stream iterator")
+            out.append("Type: Streaming response")
+            out.append("Note: Chunks will be processed by the stream iterator")
         else:
-            try:
-                # Check if response has been read
-                if not hasattr(response, "_content"):
-                    # Response hasn't been read yet, read it now
-                    response.read()
-                
-                body = json.loads(response.text)
+            out.append(f"Content-Length: {response.headers.get('content-length', 'unknown')}")
+        
+        out.append(_SEPARATOR + "\n")
+        print("\n".join(out))
+    
+    def _log_completion(self, completion: Any) -> None:
+        """Log a parsed chat completion for debugging.
+        
+        Reads the ChatCompletion the SDK already built, so the response body
+        is not parsed a second time just for logging.
+        
+        Args:
+            completion: ChatCompletion returned by chat.completions.create()
+        """
+        out = [
+            _SEPARATOR,
+            "🟢 OPENAI API COMPLETION",
+            _SEPARATOR,
+            f"Model: {completion.model}",
+        ]
+        
+        usage = completion.usage
+        if usage:
+            out.append("Usage:")
+            out.append(f"  Prompt tokens: {usage.prompt_tokens}")
+            out.append(f"  Completion tokens: {usage.completion_tokens}")
+            out.append(f"  Total tokens: {usage.total_tokens}")
+        
+        choices = completion.choices
+        if choices:
+            out.append(f"\nChoices: {len(choices)}")
+            for i, choice in enumerate(choices, 1):
+                message = choice.message
+                content = message.content
+                tool_calls = message.tool_calls or []
                 
-                # Extract key information from response
-                choices = body.get('choices', [])
-                usage = body.get('usage', {})
-                model = body.get('model', 'unknown')
+                out.append(f"  [{i}] Finish reason: {choice.finish_reason or 'unknown'}")
                 
-                print(f"Model: {model}")
+                # Check if both content and tool_calls are present
+                has_content = isinstance(content, str) and content
                 
-                if usage:
-                    print(f"Usage:")
-                    print(f"  Prompt tokens: {usage.get('prompt_tokens', 0)}")
-                    print(f"  Completion tokens: {usage.get('completion_tokens', 0)}")
-                    print(f"  Total tokens: {usage.get('total_tokens', 0)}")
+                if has_content and tool_calls:
+                    out.append("      ✨ BOTH content AND tool_calls present!")
                 
-                if choices:
-                    print(f"\nChoices: {len(choices)}")
-                    for i, choice in enumerate(choices, 1):
-                        message = choice.get('message', {})
-                        content = message.get('content', '')
-                        tool_calls = message.get('tool_calls', [])
-                        finish_reason = choice.get('finish_reason', 'unknown')
-                        
-                        print(f"  [{i}] Finish reason: {finish_reason}")
-                        
-                        # Check if both content and tool_calls are present
-                        has_content = content and isinstance(content, str)
-                        has_tool_calls = tool_calls and len(tool_calls) > 0
-                        
-                        if has_content and has_tool_calls:
-                            print(f"      ✨ BOTH content AND tool_calls present!")
-                        
-                        if has_content:
-                            preview = content[:100].replace('\n', ' ')
-                            if len(content) > 100:
-                                preview += "..."
-                            print(f"      Content: {preview}")
-                        
-                        if has_tool_calls:
-                            print(f"      Tool calls: {len(tool_calls)}")
-                            for tc in tool_calls:
-                                func = tc.get('function', {})
-                                print(f"        - {func.get('name', 'unknown')}")
+                if has_content:
+                    preview = content[:100].replace('\n', ' ')
+                    if len(content) > 100:
+                        preview += "..."
+                    out.append(f"      Content: {preview}")
                 
-            except Exception as e:
-                print(f"Body: <unable to parse: {e}>")
-                # Don't try to access response.text if it failed above
+                if tool_calls:
+                    out.append(f"      Tool calls: {len(tool_calls)}")
+                    for tc in tool_calls:
+                        func = getattr(tc, 'function', None)
+                        out.append(f"        - {getattr(func, 'name', 'unknown')}")
         
-        print("="*80 + "\n")
+        out.append(_SEPARATOR + "\n")
+        print("\n".join(out))
     
     def set_model(self, model: str) -> None:
         """Change the current model used for completions.
@@ -253,47 +456,92 @@ class ShelloClient:
         """
         return self._model
     
-    def chat(self, messages: List[Dict[str, Any]], tools: Optional[List[ShelloTool]] = None) -> Dict[str, Any]:
-        """Send a chat completion request and return the response.
+    def _get_tools_dicts(self, tools: List[ShelloTool]) -> List[Dict[str, Any]]:
+        """Convert ShelloTool objects to request dictionaries, reusing prior results.
+        
+        The agent sends the same tool schemas on every turn, so the converted
+        list is cached by the identities of the tool objects. The cache entry
+        holds references to those objects, which keeps the ids valid while
+        cached. The oldest entry is evicted once _TOOLS_CACHE_SIZE is reached.
+        
+        Args:
+            tools: List of tools available for function calling
+        
+        Returns:
+            List of {"type", "function"} dictionaries for the request
+        """
+        key = tuple(map(id, tools))
+        cached = self._tools_cache.get(key)
+        if cached is None:
+            tools_dicts = [
+                {
+                    "type": tool.type,
+                    "function": tool.function
+                }
+                for tool in tools
+            ]
+            if len(self._tools_cache) >= _TOOLS_CACHE_SIZE:
+                del self._tools_cache[next(iter(self._tools_cache))]
+            cached = (tuple(tools), tools_dicts)
+            self._tools_cache[key] = cached
+        return cached[1]
+    
+    def _build_request_params(
+        self,
+        messages: List[Dict[str, Any]],
+        tools: Optional[List[ShelloTool]],
+        stream: bool = False
+    ) -> Dict[str, Any]:
+        """Build the chat.completions.create() arguments shared by chat and chat_stream.
         
         Args:
             messages: List of message dictionaries with role and content
             tools: Optional list of tools available for function calling
+            stream: Whether to request a streaming response
         
         Returns:
-            Dictionary containing the API response with choices, usage, etc.
-        
-        Raises:
-            Exception: If the API request fails
+            Keyword arguments for the completions API call
         """
-        # Prepare the request parameters
         request_params: Dict[str, Any] = {
             "model": self._model,
             "messages": messages
         }
+        if stream:
+            request_params["stream"] = True
         
-        # Add tools if provided
+        # Add tools if provided (converted dictionaries are cached per tool set)
         if tools:
-            # Convert ShelloTool objects to dictionaries
-            tools_dicts = [
-                {
-                    "type": tool.type,
-                    "function": tool.function
-                }
-                for tool in tools
-            ]
-            request_params["tools"] = tools_dicts
+            request_params["tools"] = self._get_tools_dicts(tools)
+        
+        return request_params
+    
+    def chat(self, messages: List[Dict[str, Any]], tools: Optional[List[ShelloTool]] = None) -> Dict[str, Any]:
+        """Send a chat completion request and return the response.
+        
+        Args:
+            messages: List of message dictionaries with role and content
+            tools: Optional list of tools available for function calling
+        
+        Returns:
+            Dictionary containing the API response with choices, usage, etc.
+        
+        Raises:
+            Exception: If the API request fails
+        """
+        request_params = self._build_request_params(messages, tools)
         
         try:
             # Make the API call
             response = self._client.chat.completions.create(**request_params)
             
+            if self._debug_level >= DEBUG_FULL:
+                self._log_completion(response)
+            
             # Convert response to dictionary format
             return response.model_dump()
         except Exception as e:
             # Re-raise with descriptive error message
             raise Exception(f"OpenAI API error: {str(e)}") from e
-
     
     def chat_stream(self, messages: List[Dict[str, Any]], tools: Optional[List[ShelloTool]] = None) -> Generator[Dict[str, Any], None, None]:
         """Stream chat completion response chunks as they arrive.
@@ -311,24 +559,7 @@ class ShelloClient:
         Raises:
             Exception: If the API request fails
         """
-        # Prepare the request parameters
-        request_params: Dict[str, Any] = {
-            "model": self._model,
-            "messages": messages,
-            "stream": True
-        }
-        
-        # Add tools if provided
-        if tools:
-            # Convert ShelloTool objects to dictionaries
-            tools_dicts = [
-                {
-                    "type": tool.type,
-                    "function": tool.function
-                }
-                for tool in tools
-            ]
-            request_params["tools"] = tools_dicts
+        request_params = self._build_request_params(messages, tools, stream=True)
         
         try:
             # Make the streaming API call
@@ -340,7 +571,7 @@ class ShelloClient:
             # Yield each chunk as it arrives
             for chunk in stream:
                 if chunk is not None:
-                    yield chunk.model_dump()
+                    yield _chunk_to_dict(chunk)
         except Exception as e:
             # Re-raise with descriptive error message
             raise Exception(f"OpenAI API streaming error: {str(e)}") from e
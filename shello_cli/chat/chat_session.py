@@ -1,33 +1,112 @@
 """ChatSession - Manages the chat session with AI"""
-from shello_cli.agent.shello_agent import ShelloAgent, ChatEntry
+from shello_cli.agent.shello_agent import ShelloAgent
 from datetime import datetime, timezone
 import os
 from shello_cli.ui.ui_renderer import (
     console,
     render_tool_execution
 )
-from rich.markdown import Markdown
 from rich.live import Live
+from rich.console import Group, RenderableType
+from rich.text import Text
 from shello_cli.ui.custom_markdown import EnhancedMarkdown
 import getpass
 import socket
 from shello_cli.utils.system_info import get_shell_info
+import contextlib
+import functools
 import json
-from typing import TYPE_CHECKING, Optional
+import time
+import traceback
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
 if TYPE_CHECKING:
     from shello_cli.session.recorder import SessionRecorder
 
+# Minimum seconds between live markdown re-renders while content streams in
+# (every update re-parses the whole markdown)
+_LIVE_UPDATE_INTERVAL = 0.1
+
+# Markdown code fence; an odd count means the streamed text ends inside a code block
+_CODE_FENCE = "```"
+
+# Date/time format shown to the AI in the conversation context
+_CONTEXT_DATETIME_FORMAT = "%A %B %d, %Y at %I:%M %p"
+
+
+@functools.lru_cache(maxsize=1)
+def _session_environment() -> Tuple[Dict[str, str], str, str]:
+    """Shell info (without cwd), user name and hostname, looked up once per process.
+    
+    None of these change while shello runs, and socket.gethostname() can stall
+    on hosts with slow name resolution, so new sessions reuse the first lookup.
+    """
+    shell_info = get_shell_info()
+    shell_info.pop("cwd", None)
+    return shell_info, getpass.getuser(), socket.gethostname()
+
+
+def _streaming_markdown(
+    text: str, prefix_cache: Dict[int, EnhancedMarkdown]
+) -> Tuple[RenderableType, bool]:
+    """Renderable for markdown that is still streaming in.
+    
+    While the text ends inside an unclosed code fence, the markdown before the
+    fence is parsed once and reused (prefix_cache maps its length to the parsed
+    renderable) and the unfinished block is shown as plain text, so streaming
+    code does not re-parse the whole reply on every update.
+    
+    Returns:
+        Tuple of (renderable, whether it is the full markdown rendering)
+    """
+    if text.count(_CODE_FENCE) % 2 == 0:
+        return EnhancedMarkdown(text), True
+    
+    fence_start = text.rfind(_CODE_FENCE)
+    prefix = prefix_cache.get(fence_start)
+    if prefix is None:
+        prefix_cache.clear()
+        prefix = prefix_cache[fence_start] = EnhancedMarkdown(text[:fence_start])
+    return Group(prefix, Text(text[fence_start:])), False
+
+
+def _parse_tool_arguments(function_data: dict) -> Optional[dict]:
+    """Parse a tool call's JSON arguments, returning None if they are invalid."""
+    try:
+        arguments = json.loads(function_data.get("arguments", "{}"))
+    except (ValueError, TypeError):
+        return None
+    return arguments if isinstance(arguments, dict) else None
+
+
+def _with_ai_context(user_message: str, ai_context: str) -> str:
+    """Prefix a user message with direct-command context, if there is any."""
+    if not ai_context:
+        return user_message
+    return f"{ai_context}\n\nUser query: {user_message}"
+
 
 class ChatSession:
     """Manages the chat session with AI"""
     
+    __slots__ = (
+        'agent', 'conversation_started', 'system_info', 'user', 'hostname',
+        '_context_prefix', '_last_interrupted', '_interrupted_command', '_recorder'
+    )
+    
     def __init__(self, agent: ShelloAgent, recorder: Optional["SessionRecorder"] = None):
         self.agent = agent
         self.conversation_started = False
-        self.system_info = get_shell_info()
-        self.user = getpass.getuser()
-        self.hostname = socket.gethostname()
+        shell_info, self.user, self.hostname = _session_environment()
+        # The working directory can change between sessions; read it fresh
+        self.system_info = {**shell_info, "cwd": os.getcwd()}
+        # Static part of the context sent with the first message
+        self._context_prefix = (
+            f"Current system information:\n"
+            f"- OS: {self.system_info['os_name']}\n"
+            f"- Shell: {self.system_info['shell']} ({self.system_info['shell_executable']})\n"
+            f"- Working Directory: {self.system_info['cwd']}\n"
+        )
         self._last_interrupted = False  # Track if last execution was interrupted
         self._interrupted_command = None  # Store the interrupted command
         self._recorder: Optional["SessionRecorder"] = recorder
@@ -36,9 +115,13 @@ class ChatSession:
         """Attach or replace the session recorder."""
         self._recorder = recorder
     
-    def start_conversation(self, user_message: str, raw_user_message: str = "") -> None:
-        """Start a new conversation with initial instructions and user message"""
-        current_datetime = datetime.now().strftime("%A %B %d, %Y at %I:%M %p")
+    def start_conversation(self, user_message: str, ai_context: str = "") -> None:
+        """Start a new conversation with initial instructions and user message.
+        
+        ai_context carries direct commands run since the last AI turn; it is
+        only added to the message sent to the agent, not the recorded prompt.
+        """
+        current_datetime = datetime.now().strftime(_CONTEXT_DATETIME_FORMAT)
         
         # Check if previous execution was interrupted
         if self._last_interrupted:
@@ -48,25 +131,25 @@ class ChatSession:
         else:
             interrupt_context = ""
         
-        # Format system context
+        # Format system context (only the date/time and message vary per call)
         context = (
-            f"Current system information:\n"
-            f"- OS: {self.system_info['os_name']}\n"
-            f"- Shell: {self.system_info['shell']} ({self.system_info['shell_executable']})\n"
-            f"- Working Directory: {self.system_info['cwd']}\n"
+            f"{self._context_prefix}"
             f"- Date/Time: {current_datetime}\n\n"
-            f"User message: {user_message}{interrupt_context}"
+            f"User message: {_with_ai_context(user_message, ai_context)}{interrupt_context}"
         )
         
         # Record user_prompt entry (use raw message for readability)
-        self._record_user_prompt(raw_user_message or user_message)
+        self._record_user_prompt(user_message)
 
         # Process the message through the agent
         self._process_message(context)
         self.conversation_started = True
     
-    def continue_conversation(self, user_message: str) -> None:
-        """Continue an existing conversation with a new user message"""
+    def continue_conversation(self, user_message: str, ai_context: str = "") -> None:
+        """Continue an existing conversation with a new user message.
+        
+        ai_context is handled as in start_conversation.
+        """
         # Check if previous execution was interrupted
         if self._last_interrupted:
             interrupt_context = f"\n\n[SYSTEM: Previous command was interrupted by user (Ctrl+C): {self._interrupted_command}]"
@@ -77,7 +160,7 @@ class ChatSession:
         # Record user_prompt entry
         self._record_user_prompt(user_message)
 
-        self._process_message(user_message)
+        self._process_message(_with_ai_context(user_message, ai_context))
 
     def _record_user_prompt(self, message: str) -> None:
         """Record a user_prompt entry and the corresponding api_message."""
@@ -101,11 +184,18 @@ class ChatSession:
         console.print("🐚 Shello", style="bold blue")
         console.print()  # Add spacing after header
         
-        accumulated_content = ""
+        # Content pieces of the current section, joined when needed instead of
+        # growing one string with += (quadratic in the response length)
+        content_parts: List[str] = []
         accumulated_tool_output = ""
         current_tool_call = None
         current_command = None  # Track current executing command
-        live_display_active = True  # Track if live display is still active
+        # Live redraws are pointless when output goes to a pipe or file; without
+        # it each section is printed once, like after Live stops at a tool call
+        live_display_active = console.is_terminal  # Track if live display is still active
+        last_live_update = 0.0  # monotonic time of the last live.update
+        live_stale = False  # Live is not showing the full markdown of the content
+        fence_prefix_cache: Dict[int, EnhancedMarkdown] = {}  # See _streaming_markdown
         
         try:
             stream = self.agent.process_user_message_stream(message)
@@ -116,19 +206,36 @@ class ChatSession:
                 return
             
             # Use Live display for streaming markdown updates
-            with Live(EnhancedMarkdown(""), console=console, refresh_per_second=10) as live:
+            if live_display_active:
+                # Redraw only when updated below; an auto-refresh thread would
+                # re-render the same markdown between updates
+                live_context = Live(EnhancedMarkdown(""), console=console, auto_refresh=False)
+            else:
+                live_context = contextlib.nullcontext()
+            with live_context as live:
                 for chunk in stream:
                     if chunk.type == "content":
                         # Accumulate content and update live markdown display
                         if chunk.content:
-                            accumulated_content += chunk.content
+                            content_parts.append(chunk.content)
                             # Only update live display if it's still active
                             if live_display_active:
-                                live.update(EnhancedMarkdown(accumulated_content))
+                                now = time.monotonic()
+                                if now - last_live_update >= _LIVE_UPDATE_INTERVAL:
+                                    renderable, complete = _streaming_markdown(
+                                        "".join(content_parts), fence_prefix_cache
+                                    )
+                                    live.update(renderable, refresh=True)
+                                    last_live_update = now
+                                    # A half-streamed code block is re-rendered as markdown at the end
+                                    live_stale = not complete
+                                else:
+                                    live_stale = True
                     
                     elif chunk.type == "tool_calls":
                         # Tool calls received - finalize any accumulated content before showing tools
                         if chunk.tool_calls:
+                            accumulated_content = "".join(content_parts)
                             # Record accumulated AI response before tool calls
                             if accumulated_content:
                                 self._record_ai_response(accumulated_content)
@@ -136,7 +243,10 @@ class ChatSession:
                             self._record_assistant_api_message(accumulated_content, chunk.tool_calls)
 
                             if live_display_active:
-                                # Live display is active - stop it (this preserves what's shown)
+                                # Live display is active - show any throttled content,
+                                # then stop it (this preserves what's shown)
+                                if live_stale:
+                                    live.update(EnhancedMarkdown(accumulated_content))
                                 live.stop()
                                 live_display_active = False
                                 # Content was shown via live display, just add spacing
@@ -147,33 +257,38 @@ class ChatSession:
                                 if accumulated_content:
                                     console.print(EnhancedMarkdown(accumulated_content))
                                     console.print()
-                            accumulated_content = ""  # Reset for next section
+                            content_parts.clear()  # Reset for next section
                     
                     elif chunk.type == "tool_call":
                         # Individual tool call starting
                         if chunk.tool_call:
                             current_tool_call = chunk.tool_call
                             accumulated_tool_output = ""
-                            # Extract command for interrupt tracking
+                            # Parse arguments once for tracking, rendering and recording
                             func_data = chunk.tool_call.get("function", {})
+                            arguments = _parse_tool_arguments(func_data)
+                            # Extract command for interrupt tracking
                             if func_data.get("name") == "run_shell_command":
-                                try:
-                                    args = json.loads(func_data.get("arguments", "{}"))
-                                    current_command = args.get("command", "")
-                                except Exception:
+                                if arguments is not None:
+                                    current_command = arguments.get("command", "")
+                                else:
                                     current_command = "unknown command"
                             else:
                                 current_command = f"{func_data.get('name', 'tool')} execution"
                             
-                            self._handle_tool_call(chunk.tool_call)
-                            self._record_tool_execution(chunk.tool_call)
+                            # Directory the call runs in, shown and recorded alike
+                            cwd = self.agent.get_current_directory()
+                            self._handle_tool_call(chunk.tool_call, arguments, cwd)
+                            self._record_tool_execution(chunk.tool_call, arguments, cwd)
                             console.print()  # Add newline after tool header
                     
                     elif chunk.type == "tool_output":
                         # Stream tool output as it arrives
                         if chunk.content:
                             accumulated_tool_output += chunk.content
-                            console.print(chunk.content, end="", markup=False)
+                            # Plain write: no markup, highlighting or re-wrapping of
+                            # command output (several times cheaper per line than print)
+                            console.out(chunk.content, end="", highlight=False)
                     
                     elif chunk.type == "tool_result":
                         # Tool execution complete — record output and api_message
@@ -195,11 +310,14 @@ class ChatSession:
                         break
                 
                 # After the loop ends, handle any remaining accumulated content
+                accumulated_content = "".join(content_parts)
                 if accumulated_content:
                     self._record_ai_response(accumulated_content)
                     self._record_assistant_api_message(accumulated_content, None)
                     if live_display_active:
                         # Live display is still active - stop it and let it show the final content
+                        if live_stale:
+                            live.update(EnhancedMarkdown(accumulated_content))
                         live.stop()
                         live_display_active = False
                     else:
@@ -233,7 +351,6 @@ class ChatSession:
         except Exception as e:
             self._record_error(str(e))
             console.print(f"\n✗ Error: {str(e)}", style="bold red")
-            import traceback
             console.print(traceback.format_exc(), style="dim red")
             console.print()
 
@@ -260,16 +377,17 @@ class ChatSession:
             msg["tool_calls"] = tool_calls
         self._recorder.record_api_message(msg)
 
-    def _record_tool_execution(self, tool_call: dict) -> None:
+    def _record_tool_execution(
+        self, tool_call: dict, parsed_arguments: Optional[dict] = None, cwd: Optional[str] = None
+    ) -> None:
         if self._recorder is None or not self._recorder.is_recording:
             return
         from shello_cli.session.models import SessionEntry
         func_data = tool_call.get("function", {})
         tool_name = func_data.get("name", "")
-        try:
-            parameters = json.loads(func_data.get("arguments", "{}"))
-        except Exception:
-            parameters = {}
+        if parsed_arguments is None:
+            parsed_arguments = _parse_tool_arguments(func_data)
+        parameters = parsed_arguments if parsed_arguments is not None else {}
         self._recorder.record(SessionEntry(
             entry_type="tool_execution",
             timestamp=datetime.now(timezone.utc),
@@ -278,7 +396,7 @@ class ChatSession:
             metadata={
                 "tool_name": tool_name,
                 "parameters": parameters,
-                "cwd": self.agent.get_current_directory(),
+                "cwd": cwd if cwd is not None else self.agent.get_current_directory(),
             },
         ))
 
@@ -322,26 +440,34 @@ class ChatSession:
             content=error_msg,
         ))
     
-    def _handle_tool_call(self, tool_call: dict) -> None:
-        """Handle a tool call from the AI - renders tool execution for any tool"""
+    def _handle_tool_call(
+        self, tool_call: dict, parsed_arguments: Optional[dict] = None, cwd: Optional[str] = None
+    ) -> None:
+        """Handle a tool call from the AI - renders tool execution for any tool
+        
+        Args:
+            tool_call: Tool call dictionary in OpenAI format
+            parsed_arguments: Arguments already parsed by the caller; parsed from
+                the tool call when omitted. Nothing is rendered if they are invalid.
+            cwd: Working directory to show; read from the agent when omitted
+        """
         function_data = tool_call.get("function", {})
         function_name = function_data.get("name")
         
         if not function_name:
             return
         
-        # Parse arguments
-        try:
-            arguments_str = function_data.get("arguments", "{}")
-            arguments = json.loads(arguments_str)
-            
-            # Render tool execution for ALL tools (bash, analyze_json, etc.)
-            render_tool_execution(
-                tool_name=function_name,
-                parameters=arguments,
-                cwd=self.agent.get_current_directory(),
-                user=self.user,
-                hostname=self.hostname
-            )
-        except json.JSONDecodeError:
-            pass
+        arguments = parsed_arguments
+        if arguments is None:
+            arguments = _parse_tool_arguments(function_data)
+            if arguments is None:
+                return
+        
+        # Render tool execution for ALL tools (bash, analyze_json, etc.)
+        render_tool_execution(
+            tool_name=function_name,
+            parameters=arguments,
+            cwd=cwd if cwd is not None else self.agent.get_current_directory(),
+            user=self.user,
+            hostname=self.hostname
+        )
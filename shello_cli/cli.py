@@ -1,17 +1,9 @@
 """Command-line interface for Shello CLI"""
 import click
 import os
+import socket
 import sys
 from pathlib import Path
-from prompt_toolkit import Application
-from prompt_toolkit.formatted_text import FormattedText
-from prompt_toolkit.key_binding import KeyBindings
-from prompt_toolkit.layout import Layout
-from prompt_toolkit.layout.containers import HSplit, Window
-from prompt_toolkit.layout.controls import FormattedTextControl
-from prompt_toolkit.styles import Style
-from shello_cli.agent.shello_agent import ShelloAgent
-from shello_cli.chat.chat_session import ChatSession
 from shello_cli.ui.ui_renderer import (
     console,
     print_welcome_banner,
@@ -20,21 +12,38 @@ from shello_cli.ui.ui_renderer import (
     display_about,
     render_direct_command_output
 )
-from shello_cli.ui.user_input import get_user_input_with_clear
 from shello_cli.settings import SettingsManager
-from shello_cli.api.client_factory import create_client
-from shello_cli.commands.command_detector import CommandDetector, InputType
-from shello_cli.commands.direct_executor import DirectExecutor
-from shello_cli.commands.context_manager import ContextManager
-from shello_cli.tools.bash_tool import BashTool
 import shello_cli as version_module
 
+# The agent, chat session, API clients and prompt_toolkit are imported inside
+# the functions that use them, so --version, config and setup start quickly
+
+# Package version shown by --version, the welcome banner and /about
+_VERSION = getattr(version_module, '__version__', '0.1.0')
+
+# Chat inputs that end the session
+_EXIT_COMMANDS = frozenset({"/quit", "/exit"})
+
 # Session store path
 _SESSION_STORE = Path.home() / ".shello_cli" / "sessions"
 
+# Display names for providers; others fall back to the capitalized provider id
+_PROVIDER_LABELS = {
+    "openai": "OpenAI-compatible API",
+    "bedrock": "AWS Bedrock"
+}
+
 
 def _interactive_pick(title: str, items: list[str], current: str | None = None) -> str | None:
     """Arrow-key interactive picker. Returns selected item or None if cancelled."""
+    from prompt_toolkit import Application
+    from prompt_toolkit.formatted_text import FormattedText
+    from prompt_toolkit.key_binding import KeyBindings
+    from prompt_toolkit.layout import Layout
+    from prompt_toolkit.layout.containers import HSplit, Window
+    from prompt_toolkit.layout.controls import FormattedTextControl
+    from prompt_toolkit.styles import Style
+
     state = {"selected": 0, "result": None}
 
     # Pre-select the current item if present
@@ -125,6 +134,10 @@ def _start_pruner_async(max_mb: int) -> None:
 
 def create_new_session(settings_manager, provider=None):
     """Create a new ShelloAgent and chat session."""
+    from shello_cli.agent.shello_agent import ShelloAgent
+    from shello_cli.chat.chat_session import ChatSession
+    from shello_cli.api.client_factory import create_client
+
     try:
         client = create_client(settings_manager, provider=provider)
     except ValueError as e:
@@ -150,12 +163,8 @@ def switch_provider(settings_manager, agent, chat_session, context_manager, dire
         console.print("💡 [cyan]Run 'shello setup' to configure additional providers.[/cyan]\n")
         return None, None
 
-    provider_labels = {
-        "openai": "OpenAI-compatible API",
-        "bedrock": "AWS Bedrock"
-    }
-    labels = [provider_labels.get(p, p.capitalize()) for p in available_providers]
-    current_label = provider_labels.get(current_provider, current_provider.capitalize())
+    labels = [_PROVIDER_LABELS.get(p, p.capitalize()) for p in available_providers]
+    current_label = _PROVIDER_LABELS.get(current_provider, current_provider.capitalize())
     current_model = agent.get_current_model()
 
     console.print(f"\n🔄 [bold]Switch Provider[/bold]  [bright_black]current: {current_label} / {current_model}[/bright_black]\n")
@@ -172,8 +181,10 @@ def switch_provider(settings_manager, agent, chat_session, context_manager, dire
         console.print(f"✓ [green]Already using {current_label}.[/green]\n")
         return None, None
 
-    old_history = agent.get_chat_history()
-    old_messages = agent._messages.copy()
+    # The history lists move to the new agent instead of being copied: the old
+    # agent is dropped on success, and on failure it still owns them unchanged
+    old_history = agent._chat_history
+    old_messages = agent._messages
     agent.clear_cache()
     settings_manager.set_provider(new_provider)
 
@@ -184,15 +195,17 @@ def switch_provider(settings_manager, agent, chat_session, context_manager, dire
         direct_executor.set_bash_tool(new_agent.get_bash_tool())
         new_model = new_agent.get_current_model()
 
-        console.print(f"\n✓ [green]Switched to {selected_label}[/green]")
-        console.print(f"  Model: [cyan]{new_model}[/cyan]")
-        console.print(f"  Conversation history preserved\n")
+        with console:
+            console.print(f"\n✓ [green]Switched to {selected_label}[/green]")
+            console.print(f"  Model: [cyan]{new_model}[/cyan]")
+            console.print("  Conversation history preserved\n")
 
         return new_agent, new_chat_session
 
     except Exception as e:
-        console.print(f"\n✗ [red]Failed to switch provider: {str(e)}[/red]")
-        console.print("⚠️  [yellow]Staying on current provider.[/yellow]\n")
+        with console:
+            console.print(f"\n✗ [red]Failed to switch provider: {str(e)}[/red]")
+            console.print("⚠️  [yellow]Staying on current provider.[/yellow]\n")
         settings_manager.set_provider(current_provider)
         return None, None
 
@@ -279,7 +292,7 @@ def handle_history_command(
         if confirm:
             pruner = SessionPruner(_SESSION_STORE)
             if pruner.delete_session(session_id):
-                console.print(f"✓ [green]Session deleted.[/green]\n")
+                console.print("✓ [green]Session deleted.[/green]\n")
             else:
                 console.print("✗ [red]Session not found.[/red]\n")
         else:
@@ -372,11 +385,10 @@ def version_callback(ctx, param, value):
     if not value or ctx.resilient_parsing:
         return
 
-    version = getattr(version_module, '__version__', '0.1.0')
     try:
-        click.echo(f"🌊 Shello CLI - Version: {version}")
+        click.echo(f"🌊 Shello CLI - Version: {_VERSION}")
     except UnicodeEncodeError:
-        click.echo(f"Shello CLI - Version: {version}")
+        click.echo(f"Shello CLI - Version: {_VERSION}")
 
     ctx.exit()
 
@@ -392,21 +404,35 @@ def cli(ctx):
 
 @cli.command()
 @click.option("--debug", is_flag=True, help="Enable debug mode")
+@click.option("--debug-level", type=click.Choice(["summary", "full", "verbose"]), default=None,
+              help="Log API requests and responses: summary (one line per call), full "
+                   "(streaming requests summarised) or verbose (everything dumped)")
 @click.option("--new", is_flag=True, help="Start a new conversation")
 @click.option("--yolo", is_flag=True, help="Enable YOLO mode (bypass approval checks)")
-def chat(debug, new, yolo):
+def chat(debug, debug_level, new, yolo):
     """Start a chat session with AI"""
+    from shello_cli.ui.user_input import get_user_input_with_clear
+    from shello_cli.commands.command_detector import CommandDetector, InputType
+    from shello_cli.commands.direct_executor import DirectExecutor
+    from shello_cli.commands.context_manager import ContextManager
+
     settings_manager = SettingsManager.get_instance()
 
+    if debug_level:
+        from shello_cli.api import DEBUG_SUMMARY, DEBUG_FULL, DEBUG_VERBOSE
+        levels = {"summary": DEBUG_SUMMARY, "full": DEBUG_FULL, "verbose": DEBUG_VERBOSE}
+        settings_manager.set_debug_level_for_session(levels[debug_level])
+
     if yolo:
         settings_manager.enable_yolo_mode_for_session()
         console.print("⚠️  [yellow]YOLO MODE ENABLED - Approval checks bypassed (denylist still active)[/yellow]\n")
 
+    # Resolved once per chat; used for every prompt and command header
+    name = os.environ.get('USER', os.environ.get('USERNAME', 'User'))
+    hostname = socket.gethostname()
+
     try:
         agent, chat_session = create_new_session(settings_manager)
-        name = os.environ.get('USER', os.environ.get('USERNAME', 'User'))
-        import socket
-        hostname = socket.gethostname()
     except Exception as e:
         console.print(f"✗ [red]Failed to initialize agent: {str(e)}[/red]")
         console.print("⚠ [yellow]Please check your API key and settings[/yellow]")
@@ -417,8 +443,12 @@ def chat(debug, new, yolo):
     context_manager = ContextManager()
     direct_executor.set_bash_tool(agent.get_bash_tool())
 
-    os.system('cls' if os.name == 'nt' else 'clear')
-    print_welcome_banner(None, getattr(version_module, '__version__', '0.1.0'))
+    # Control codes instead of spawning a cls/clear process; Rich uses the
+    # console API on legacy Windows terminals and skips non-terminal output.
+    # Inside the console context the clear and banner go out in one write.
+    with console:
+        console.clear()
+        print_welcome_banner(None, _VERSION)
 
     # --- Session recording setup ---
     enabled, max_mb = _get_session_config(settings_manager)
@@ -444,9 +474,18 @@ def chat(debug, new, yolo):
             console.print(
                 f"\n💡 [cyan]Update available:[/cyan] "
                 f"[dim]{check_result.current_version}[/dim] → "
-                f"[bold]{check_result.latest_version}[/bold]"
+                f"[bold]{check_result.latest_version}[/bold]\n"
+                "   Run [bold]/update[/bold] to upgrade\n"
             )
-            console.print("   Run [bold]/update[/bold] to upgrade\n")
+
+    # Direct-command output is echoed line by line while the command runs;
+    # output_streamed is reset before each command
+    output_streamed = False
+
+    def _echo_output(line):
+        nonlocal output_streamed
+        output_streamed = True
+        console.out(line, end="", highlight=False)
 
     # Main chat loop
     while True:
@@ -460,90 +499,92 @@ def chat(debug, new, yolo):
                 console.print("\n\n👋 Goodbye! Thanks for using Shello CLI", style="yellow")
                 break
 
-            if user_input.lower() in ["/quit", "/exit"]:
-                if recorder is not None:
-                    recorder.finalize()
-                console.print("\n👋 Goodbye! Thanks for using Shello CLI", style="yellow")
-                break
-
-            elif user_input.lower() == "/switch":
-                result = switch_provider(
-                    settings_manager, agent, chat_session,
-                    context_manager, direct_executor
-                )
-                if result[0] is not None:
-                    agent, chat_session = result
-                continue
-
-            elif user_input.lower() == "/model":
-                switch_model(settings_manager, agent)
-                continue
-
-            elif user_input.lower() == "/new":
-                # Finalize current recorder
-                if recorder is not None:
-                    recorder.finalize()
-
-                agent.clear_cache()
-                agent, chat_session = create_new_session(settings_manager)
-                context_manager.clear_history()
-                direct_executor.set_bash_tool(agent.get_bash_tool())
-
-                # Start a fresh recorder for the new session (lazy — starts on first message)
-                current_provider = settings_manager.get_provider()
-                current_model = agent.get_current_model()
-                recorder = _make_recorder(settings_manager, current_provider, current_model)
-                chat_session.set_recorder(recorder)
-
-                console.print("\n\n✓ [green]Starting new conversation...[/green]")
-                print_header("New conversation started")
-                continue
-
-            elif user_input.lower().startswith("/history"):
-                recorder = handle_history_command(
-                    user_input, settings_manager, agent, chat_session,
-                    recorder, direct_executor, name
-                )
-                continue
-
-            elif user_input.lower() == "/help":
-                display_help()
-                continue
-
-            elif user_input.lower() == "/about":
-                display_about(getattr(version_module, '__version__', '0.1.0'))
-                continue
-
-            elif user_input.lower().startswith("/update"):
-                from shello_cli.update.update_manager import UpdateManager
-                force = "--force" in user_input.lower()
-                update_manager = UpdateManager()
-                console.print()
-                result = update_manager.perform_update(force=force)
-                if result.success:
-                    console.print(f"✓ [green]{result.message}[/green]")
-                    if result.new_version and "already on the latest version" not in result.message.lower():
-                        console.print(f"  Updated to version [cyan]{result.new_version}[/cyan]")
-                        console.print("\n⚠️  [yellow]Please restart Shello CLI to use the new version.[/yellow]\n")
-                    else:
-                        console.print()
-                else:
-                    console.print(f"✗ [red]{result.message}[/red]")
-                    if result.error:
-                        console.print(f"  Error: {result.error}\n")
-                continue
-
             if not user_input.strip():
                 continue
 
             detection_result = command_detector.detect(user_input)
 
-            if detection_result.input_type == InputType.DIRECT_COMMAND:
-                execution_result = direct_executor.execute(
-                    detection_result.command,
-                    detection_result.args
-                )
+            if detection_result.input_type == InputType.INTERNAL_COMMAND:
+                # Slash command, lowercased by the detector
+                command = detection_result.command
+
+                if command in _EXIT_COMMANDS:
+                    if recorder is not None:
+                        recorder.finalize()
+                    console.print("\n👋 Goodbye! Thanks for using Shello CLI", style="yellow")
+                    break
+
+                elif command == "/switch":
+                    result = switch_provider(
+                        settings_manager, agent, chat_session,
+                        context_manager, direct_executor
+                    )
+                    if result[0] is not None:
+                        agent, chat_session = result
+                    continue
+
+                elif command == "/model":
+                    switch_model(settings_manager, agent)
+                    continue
+
+                elif command == "/new":
+                    # Finalize current recorder
+                    if recorder is not None:
+                        recorder.finalize()
+
+                    agent.clear_cache()
+                    agent, chat_session = create_new_session(settings_manager)
+                    context_manager.clear_history()
+                    direct_executor.set_bash_tool(agent.get_bash_tool())
+
+                    # Start a fresh recorder for the new session (lazy — starts on first message)
+                    current_provider = settings_manager.get_provider()
+                    current_model = agent.get_current_model()
+                    recorder = _make_recorder(settings_manager, current_provider, current_model)
+                    chat_session.set_recorder(recorder)
+
+                    with console:
+                        console.print("\n\n✓ [green]Starting new conversation...[/green]")
+                        print_header("New conversation started")
+                    continue
+
+                elif command.startswith("/history"):
+                    recorder = handle_history_command(
+                        user_input, settings_manager, agent, chat_session,
+                        recorder, direct_executor, name
+                    )
+                    continue
+
+                elif command == "/help":
+                    with console:
+                        display_help()
+                    continue
+
+                elif command == "/about":
+                    with console:
+                        display_about(_VERSION)
+                    continue
+
+                elif command.startswith("/update"):
+                    from shello_cli.update.update_manager import UpdateManager
+                    force = "--force" in command
+                    update_manager = UpdateManager()
+                    console.print()
+                    result = update_manager.perform_update(force=force)
+                    if result.success:
+                        console.print(f"✓ [green]{result.message}[/green]")
+                        if result.new_version and "already on the latest version" not in result.message.lower():
+                            console.print(f"  Updated to version [cyan]{result.new_version}[/cyan]")
+                            console.print("\n⚠️  [yellow]Please restart Shello CLI to use the new version.[/yellow]\n")
+                        else:
+                            console.print()
+                    else:
+                        console.print(f"✗ [red]{result.message}[/red]")
+                        if result.error:
+                            console.print(f"  Error: {result.error}\n")
+                    continue
 
+            if detection_result.input_type == InputType.DIRECT_COMMAND:
                 console.print()
                 render_direct_command_output(
                     command=user_input,
@@ -552,8 +593,15 @@ def chat(debug, new, yolo):
                     hostname=hostname
                 )
 
+                output_streamed = False
+                execution_result = direct_executor.execute(
+                    detection_result.command,
+                    detection_result.args,
+                    on_output=_echo_output
+                )
+
                 if execution_result.success:
-                    if execution_result.output:
+                    if execution_result.output and not output_streamed:
                         console.print(execution_result.output)
                     # Sync directory change to BashTool so AI commands use the new cwd
                     if execution_result.directory_changed and execution_result.new_directory:
@@ -590,16 +638,14 @@ def chat(debug, new, yolo):
                     cache_id=execution_result.cache_id
                 )
             else:
+                # Only commands not yet reported to the AI; the session adds
+                # them to the message it sends
                 ai_context = context_manager.get_context_for_ai()
-                if ai_context:
-                    enhanced_input = f"{ai_context}\n\nUser query: {user_input}"
-                else:
-                    enhanced_input = user_input
 
                 if not chat_session.conversation_started:
-                    chat_session.start_conversation(enhanced_input, raw_user_message=user_input)
+                    chat_session.start_conversation(user_input, ai_context=ai_context)
                 else:
-                    chat_session.continue_conversation(user_input)
+                    chat_session.continue_conversation(user_input, ai_context=ai_context)
 
         except KeyboardInterrupt:
             agent.clear_cache()
@@ -608,10 +654,11 @@ def chat(debug, new, yolo):
             console.print("\n\n👋 Goodbye! Thanks for using Shello CLI", style="yellow")
             break
         except Exception as e:
-            console.print(f"\n✗ Error: {str(e)}", style="bold red")
-            if debug:
-                import traceback
-                console.print(traceback.format_exc(), style="red")
+            with console:
+                console.print(f"\n✗ Error: {str(e)}", style="bold red")
+                if debug:
+                    import traceback
+                    console.print(traceback.format_exc(), style="red")
 
 
 @cli.command()
@@ -654,35 +701,37 @@ def config(edit, get, set_key, value, reset):
     project_settings = settings_manager.load_project_settings()
     current_provider = settings_manager.get_provider()
 
-    provider_labels = {
-        "openai": "OpenAI-compatible API",
-        "bedrock": "AWS Bedrock"
-    }
-
-    console.print("\n📋 [bold blue]Current Configuration:[/bold blue]")
-    console.print()
+    # Buffered so the whole report reaches the terminal in one write
+    with console:
+        console.print("\n📋 [bold blue]Current Configuration:[/bold blue]")
+        console.print()
 
-    provider_label = provider_labels.get(current_provider, current_provider.capitalize())
-    console.print(f"  🤖 [bold]Provider:[/bold] {provider_label}")
-    console.print()
+        provider_label = _PROVIDER_LABELS.get(current_provider, current_provider.capitalize())
+        console.print(f"  🤖 [bold]Provider:[/bold] {provider_label}")
+        console.print()
 
-    if current_provider == "openai":
+        # Resolved once: the provider section and the model list both read it
         try:
-            cfg = settings_manager.get_provider_config("openai")
+            cfg = settings_manager.get_provider_config(current_provider)
+            config_error = None
+        except ValueError as e:
+            cfg = {}
+            config_error = e
+
+        if config_error is not None and current_provider in _PROVIDER_LABELS:
+            console.print(f"  [red]Configuration error: {config_error}[/red]")
+
+        elif current_provider == "openai":
             api_key = cfg.get("api_key")
             if api_key:
                 masked_key = '***' + api_key[-4:] if len(api_key) >= 4 else '***'
                 console.print(f"  🔑 [bold]API Key:[/bold] {masked_key}")
             else:
-                console.print(f"  🔑 [bold]API Key:[/bold] [red]Not set[/red]")
+                console.print("  🔑 [bold]API Key:[/bold] [red]Not set[/red]")
             base_url = cfg.get("base_url", "https://api.openai.com/v1")
             console.print(f"  📡 [bold]Base URL:[/bold] {base_url}")
-        except ValueError as e:
-            console.print(f"  [red]Configuration error: {e}[/red]")
 
-    elif current_provider == "bedrock":
-        try:
-            cfg = settings_manager.get_provider_config("bedrock")
+        elif current_provider == "bedrock":
             region = cfg.get("region", "Not set")
             console.print(f"  🌍 [bold]AWS Region:[/bold] {region}")
             profile = cfg.get("profile")
@@ -693,64 +742,58 @@ def config(edit, get, set_key, value, reset):
                 masked_key = access_key[:4] + '***' + access_key[-4:] if len(access_key) >= 8 else '***'
                 console.print(f"  🔐 [bold]Credentials:[/bold] Explicit credentials ({masked_key})")
             else:
-                console.print(f"  🔐 [bold]Credentials:[/bold] Default credential chain")
-        except ValueError as e:
-            console.print(f"  [red]Configuration error: {e}[/red]")
+                console.print("  🔐 [bold]Credentials:[/bold] Default credential chain")
 
-    console.print()
+        console.print()
 
-    current_model = settings_manager.get_current_model()
-    console.print(f"  🎯 [bold]Current Model:[/bold] {current_model}")
+        current_model = settings_manager.get_current_model()
+        console.print(f"  🎯 [bold]Current Model:[/bold] {current_model}")
 
-    try:
-        cfg = settings_manager.get_provider_config(current_provider)
         models = cfg.get("models", [])
         if models:
-            console.print(f"  📚 [bold]Available Models:[/bold]")
+            console.print("  📚 [bold]Available Models:[/bold]")
             for model in models:
                 marker = "✓" if model == current_model else " "
                 console.print(f"     [{marker}] {model}")
         else:
-            console.print(f"  📚 [bold]Available Models:[/bold] [dim]None configured[/dim]")
-    except ValueError:
-        console.print(f"  📚 [bold]Available Models:[/bold] [dim]None configured[/dim]")
-
-    if project_settings.model:
-        console.print()
-        console.print(f"  ⚙️  [bold]Project Override:[/bold]")
-        console.print(f"     Model: {project_settings.model}")
+            console.print("  📚 [bold]Available Models:[/bold] [dim]None configured[/dim]")
 
-    # Display MCP servers configuration
-    has_mcp = False
-    if user_settings.mcp_servers:
-        has_mcp = True
-    if project_settings.mcp_servers:
-        has_mcp = True
+        if project_settings.model:
+            console.print()
+            console.print("  ⚙️  [bold]Project Override:[/bold]")
+            console.print(f"     Model: {project_settings.model}")
 
-    if has_mcp:
-        console.print()
-        console.print("  🔌 [bold]MCP Servers:[/bold]")
+        # Display MCP servers configuration
+        has_mcp = False
         if user_settings.mcp_servers:
-            for name, cfg in user_settings.mcp_servers.items():
-                cmd = cfg.get("command", "")
-                console.print(f"     • {name} ({cmd}) [dim][global][/dim]")
+            has_mcp = True
         if project_settings.mcp_servers:
-            for name, cfg in project_settings.mcp_servers.items():
-                cmd = cfg.get("command", "")
-                override_text = " [yellow][override][/yellow]" if user_settings.mcp_servers and name in user_settings.mcp_servers else ""
-                console.print(f"     • {name} ({cmd}) [dim][project][/dim]{override_text}")
+            has_mcp = True
 
-    available_providers = settings_manager.get_available_providers()
-    if len(available_providers) > 1:
-        console.print()
-        console.print(f"  🔄 [bold]Alternate Providers:[/bold]")
-        for provider in available_providers:
-            if provider != current_provider:
-                label = provider_labels.get(provider, provider.capitalize())
-                console.print(f"     • {label}")
-        console.print(f"     [dim]Use '/switch' during chat to switch providers[/dim]")
+        if has_mcp:
+            console.print()
+            console.print("  🔌 [bold]MCP Servers:[/bold]")
+            if user_settings.mcp_servers:
+                for name, cfg in user_settings.mcp_servers.items():
+                    cmd = cfg.get("command", "")
+                    console.print(f"     • {name} ({cmd}) [dim][global][/dim]")
+            if project_settings.mcp_servers:
+                for name, cfg in project_settings.mcp_servers.items():
+                    cmd = cfg.get("command", "")
+                    override_text = " [yellow][override][/yellow]" if user_settings.mcp_servers and name in user_settings.mcp_servers else ""
+                    console.print(f"     • {name} ({cmd}) [dim][project][/dim]{override_text}")
+
+        available_providers = settings_manager.get_available_providers()
+        if len(available_providers) > 1:
+            console.print()
+            console.print("  🔄 [bold]Alternate Providers:[/bold]")
+            for provider in available_providers:
+                if provider != current_provider:
+                    label = _PROVIDER_LABELS.get(provider, provider.capitalize())
+                    console.print(f"     • {label}")
+            console.print("     [dim]Use '/switch' during chat to switch providers[/dim]")
 
-    console.print()
+        console.print()
 
 
 @cli.command()
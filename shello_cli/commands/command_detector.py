@@ -67,6 +67,12 @@ class CommandDetector:
     PATH_PATTERN = re.compile(r'[/\\][\w\-./\\]+')
     FILE_EXTENSION_PATTERN = re.compile(r'\.\w{2,4}(?:\s|$)')
     
+    # Chat slash commands handled by the CLI itself; the prefixed ones take arguments
+    INTERNAL_COMMANDS: Set[str] = {
+        '/quit', '/exit', '/switch', '/model', '/new', '/help', '/about'
+    }
+    INTERNAL_COMMAND_PREFIXES: tuple = ('/history', '/update')
+    
     # Conversational phrases
     CONVERSATIONAL_STARTERS: Set[str] = {
         'please', 'thanks', 'thank you', 'sorry', 'excuse me',
@@ -98,6 +104,16 @@ class CommandDetector:
         
         stripped_input = user_input.strip()
         
+        # Slash commands first, so the CLI needs no separate check
+        lowered_input = stripped_input.lower()
+        if (lowered_input in self.INTERNAL_COMMANDS
+                or lowered_input.startswith(self.INTERNAL_COMMAND_PREFIXES)):
+            return DetectionResult(
+                input_type=InputType.INTERNAL_COMMAND,
+                command=lowered_input,
+                original_input=user_input
+            )
+        
         # Quick check: if it has strong shell indicators, likely a command
         if self._has_shell_indicators(stripped_input):
             parts = stripped_input.split(maxsplit=1)
@@ -5,6 +5,13 @@ from typing import Tuple, Optional
 from shello_cli.utils.json_schema_analyzer import json_to_jq_paths
 
 
+# Patterns for the <execute_command> block in AI responses, compiled once
+_EXECUTE_COMMAND_PATTERN = re.compile(r'<execute_command>(.*?)</execute_command>', re.DOTALL)
+_COMMAND_PATTERN = re.compile(r'<command>(.*?)</command>', re.DOTALL)
+_REQUIRES_APPROVAL_PATTERN = re.compile(r'<requires_approval>(.*?)</requires_approval>', re.DOTALL)
+_OUTPUT_FILTER_PATTERN = re.compile(r'<output_filter>(.*?)</output_filter>', re.DOTALL)
+
+
 class CommandExecutor:
     """Handles command execution and parsing with intelligent output filtering"""
     
@@ -15,8 +22,7 @@ class CommandExecutor:
         Returns: (command, requires_approval, output_filter)
         """
         # Look for execute_command XML tags
-        pattern = r'<execute_command>(.*?)</execute_command>'
-        match = re.search(pattern, response, re.DOTALL)
+        match = _EXECUTE_COMMAND_PATTERN.search(response)
         
         if not match:
             return None, False, None
@@ -26,9 +32,9 @@ class CommandExecutor:
             xml_content = match.group(1)
             
             # Extract command using regex instead of XML parsing to avoid issues with special characters
-            cmd_match = re.search(r'<command>(.*?)</command>', xml_content, re.DOTALL)
-            approval_match = re.search(r'<requires_approval>(.*?)</requires_approval>', xml_content, re.DOTALL)
-            filter_match = re.search(r'<output_filter>(.*?)</output_filter>', xml_content, re.DOTALL)
+            cmd_match = _COMMAND_PATTERN.search(xml_content)
+            approval_match = _REQUIRES_APPROVAL_PATTERN.search(xml_content)
+            filter_match = _OUTPUT_FILTER_PATTERN.search(xml_content)
             
             if not cmd_match or not approval_match:
                 print("\033[91mMissing required command elements\033[0m")
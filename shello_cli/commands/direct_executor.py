@@ -6,13 +6,30 @@ directly without AI processing, while maintaining directory state.
 """
 
 from dataclasses import dataclass
-from typing import Optional
+from typing import Callable, Optional
 import subprocess
 import os
 import platform
+import queue
+import signal
+import threading
+import time
 from shello_cli.utils.output_utils import strip_line_padding
 
 
+def _kill_process_group(process: subprocess.Popen) -> None:
+    """Kill a process started by DirectExecutor together with its children."""
+    try:
+        if os.name == 'nt':
+            process.kill()
+        else:
+            os.killpg(process.pid, signal.SIGKILL)
+    except OSError:
+        # Already exited
+        pass
+    process.wait()
+
+
 @dataclass
 class ExecutionResult:
     """Result from direct command execution.
@@ -66,13 +83,16 @@ class DirectExecutor:
             self._shell_type = 'bash'
     
 
-    def execute(self, command: str, args: Optional[str] = None, is_safe: Optional[bool] = None) -> ExecutionResult:
+    def execute(self, command: str, args: Optional[str] = None, is_safe: Optional[bool] = None,
+                on_output: Optional[Callable[[str], None]] = None) -> ExecutionResult:
         """Execute a direct command and return the result.
         
         Args:
             command: The command to execute (e.g., 'ls', 'cd', 'pwd')
             args: Optional arguments for the command
             is_safe: Optional AI safety flag indicating if command is safe (unused for direct commands)
+            on_output: Optional callback receiving each stdout line (newline included)
+                       as the command produces it
         
         Returns:
             ExecutionResult with execution details
@@ -86,7 +106,8 @@ class DirectExecutor:
         # Trust evaluation only applies to AI-generated commands
         
         # Handle cd commands specially
-        if command.strip() == 'cd' or command.strip().startswith('cd '):
+        stripped = command.strip()
+        if stripped == 'cd' or stripped.startswith('cd '):
             return self._handle_cd_command(full_command)
         
         # Track directory before execution
@@ -95,18 +116,18 @@ class DirectExecutor:
         try:
             # Execute the command based on shell type
             if self._shell_type == 'powershell':
-                result = subprocess.run(
-                    ['powershell.exe', '-Command', full_command],
-                    cwd=self._current_directory,
-                    capture_output=True,
-                    timeout=30,
-                    encoding='utf-8',
-                    errors='replace'
-                )
+                popen_args = ['powershell.exe', '-Command', full_command]
+                use_shell = False
+            else:
+                popen_args = full_command
+                use_shell = True
+            
+            if on_output is not None:
+                result = self._run_streaming(popen_args, use_shell, on_output, timeout=30)
             else:
                 result = subprocess.run(
-                    full_command,
-                    shell=True,
+                    popen_args,
+                    shell=use_shell,
                     cwd=self._current_directory,
                     capture_output=True,
                     timeout=30,
@@ -166,6 +187,94 @@ class DirectExecutor:
                 error=f"Error executing command: {str(e)}"
             )
     
+    def _run_streaming(self, popen_args, use_shell: bool, on_output: Callable[[str], None],
+                       timeout: int) -> subprocess.CompletedProcess:
+        """Run a command, passing stdout lines to on_output as they arrive.
+        
+        stdout and stderr are read on helper threads, so the timeout holds even
+        while a pipe stays open. The command runs in its own process group, and
+        the whole group is killed on timeout or when the caller is interrupted
+        (an on_output error or Ctrl+C), so pipeline members do not outlive it.
+        
+        Args:
+            popen_args: Command string (shell) or argument list
+            use_shell: Whether to run through the shell
+            on_output: Callback receiving each stdout line as read
+            timeout: Seconds before the command is killed
+        
+        Returns:
+            CompletedProcess with the full stdout and stderr
+        
+        Raises:
+            subprocess.TimeoutExpired: If the command ran past the timeout
+        """
+        process = subprocess.Popen(
+            popen_args,
+            shell=use_shell,
+            cwd=self._current_directory,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            encoding='utf-8',
+            errors='replace',
+            bufsize=1,
+            start_new_session=(os.name != 'nt')
+        )
+        
+        stdout_queue: queue.Queue = queue.Queue()
+        stderr_parts = []
+        
+        def _read_stdout():
+            try:
+                for line in process.stdout:
+                    stdout_queue.put(line)
+            except (OSError, ValueError):
+                pass
+            finally:
+                stdout_queue.put(None)
+                process.stdout.close()
+        
+        def _read_stderr():
+            try:
+                stderr_parts.append(process.stderr.read())
+            except (OSError, ValueError):
+                pass
+            finally:
+                process.stderr.close()
+        
+        readers = [
+            threading.Thread(target=_read_stdout, daemon=True),
+            threading.Thread(target=_read_stderr, daemon=True),
+        ]
+        for reader in readers:
+            reader.start()
+        
+        deadline = time.monotonic() + timeout
+        stdout_lines = []
+        try:
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise subprocess.TimeoutExpired(popen_args, timeout)
+                try:
+                    line = stdout_queue.get(timeout=remaining)
+                except queue.Empty:
+                    continue
+                if line is None:
+                    break
+                stdout_lines.append(line)
+                on_output(line)
+            process.wait(timeout=max(deadline - time.monotonic(), 0))
+        except BaseException:
+            _kill_process_group(process)
+            raise
+        finally:
+            for reader in readers:
+                reader.join(timeout=1)
+        
+        return subprocess.CompletedProcess(
+            popen_args, process.returncode, ''.join(stdout_lines), ''.join(stderr_parts)
+        )
+    
     def _handle_cd_command(self, command: str) -> ExecutionResult:
         """Handle cd command to change working directory.
         
@@ -137,7 +137,7 @@ def config_set(key: str, value: str):
     
     # Handle nested settings
     if len(parts) < 2:
-        console.print(f"✗ [red]Invalid key format. Use dot notation (e.g., openai_config.default_model)[/red]")
+        console.print("✗ [red]Invalid key format. Use dot notation (e.g., openai_config.default_model)[/red]")
         sys.exit(1)
     
     # Navigate to parent object
@@ -151,7 +151,7 @@ def config_set(key: str, value: str):
         # If the nested object is None, we need to create it
         if obj is None:
             console.print(f"✗ [red]Cannot set '{key}' because parent object is not configured[/red]")
-            console.print(f"💡 Run 'shello setup' to configure the provider first")
+            console.print("💡 Run 'shello setup' to configure the provider first")
             sys.exit(1)
     
     # Set the final attribute
@@ -274,7 +274,7 @@ def setup_openai_provider(existing_settings):
         sys.exit(1)
     
     # Model selection
-    console.print(f"\n🤖 [bold]Default Model:[/bold]")
+    console.print("\n🤖 [bold]Default Model:[/bold]")
     console.print(f"  Suggested: {default_model}")
     use_default = click.confirm("Use suggested model?", default=True)
     
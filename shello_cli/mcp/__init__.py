@@ -1,7 +1,14 @@
+import logging
+
 from shello_cli.mcp.client import MCPClient
 from shello_cli.mcp.utils import create_mcp_client
 from shello_cli.mcp.tool_wrapper import MCPToolWrapper
 
+# Suppress verbose fastmcp logs (such as proxy warnings). fastmcp configures
+# its logger when first imported, which happens through this package, so the
+# level is set here rather than at shello_cli import time.
+logging.getLogger("fastmcp").setLevel(logging.WARNING)
+
 __all__ = [
     "MCPClient",
     "create_mcp_client",
@@ -38,6 +38,11 @@ from shello_cli.settings.models import (
 from shello_cli.settings.serializers import generate_yaml_with_comments
 
 
+# libyaml's loader parses several times faster; PyYAML falls back to the
+# pure-Python SafeLoader when it was built without libyaml
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+
 class SettingsManager:
     """Manages user and project settings with singleton pattern."""
     
@@ -49,6 +54,8 @@ class SettingsManager:
         self._project_settings_path = Path.cwd() / ".shello" / "settings.yml"
         self._user_settings: Optional[UserSettings] = None
         self._project_settings: Optional['ProjectSettings'] = None
+        # API debug logging level for this session only (0 = off)
+        self._debug_level: int = 0
     
     @classmethod
     def get_instance(cls) -> 'SettingsManager':
@@ -88,7 +95,7 @@ class SettingsManager:
         try:
             # Load YAML file with UTF-8 encoding
             with open(self._user_settings_path, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
+                data = yaml.load(f, Loader=_YAML_LOADER)
             
             # Handle empty file
             if data is None:
@@ -818,7 +825,7 @@ class SettingsManager:
         
         try:
             with open(self._project_settings_path, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f) or {}
+                data = yaml.load(f, Loader=_YAML_LOADER) or {}
             
             # Merge loaded data with defaults
             self._project_settings = ProjectSettings(
@@ -866,6 +873,24 @@ class SettingsManager:
         # Update cached settings (but don't save to file)
         self._user_settings = user_settings
 
+    def set_debug_level_for_session(self, level: int) -> None:
+        """Set the API debug logging level for the current session (not persisted).
+        
+        Clients created by the client factory afterwards use this level.
+        
+        Args:
+            level: Debug level as defined in shello_cli.api.openai_client (0 = off)
+        """
+        self._debug_level = level
+    
+    def get_debug_level(self) -> int:
+        """Get the API debug logging level for the current session.
+        
+        Returns:
+            int: The session debug level (0 when debug logging is off)
+        """
+        return self._debug_level
+
     def get_ssh_config(self) -> Optional[SSHConfig]:
         """Get merged SSH configuration. Project overrides user settings."""
         user_settings = self.load_user_settings()
@@ -5,6 +5,32 @@ from typing import Dict, Optional
 from .types import CacheEntry
 
 
+def _head_end(text: str, n: int) -> int:
+    """Index where the first n lines of text end (n >= 1).
+    
+    Only the first n newlines are scanned, so large outputs are not split.
+    """
+    end = -1
+    for _ in range(n):
+        end = text.find('\n', end + 1)
+        if end < 0:
+            return len(text)
+    return end
+
+
+def _tail_start(text: str, n: int) -> int:
+    """Index where the last n lines of text begin (n >= 1).
+    
+    Only the last n newlines are scanned, so large outputs are not split.
+    """
+    start = len(text)
+    for _ in range(n):
+        start = text.rfind('\n', 0, start)
+        if start < 0:
+            return 0
+    return start + 1
+
+
 class OutputCache:
     """
     Cache for command outputs with sequential IDs and LRU eviction.
@@ -123,21 +149,21 @@ class OutputCache:
         if output is None:
             return None
         
-        lines = output.split('\n')
-        total_lines = len(lines)
-        
-        # Parse line specification
+        # First/last N line specs slice at the boundary newlines instead of
+        # splitting the whole cached output into a list of lines
         if line_spec.startswith('+') and ',' not in line_spec:
             # "+N" - First N lines
             n = int(line_spec[1:])
-            selected_lines = lines[:n]
-            return '\n'.join(selected_lines)
+            if n > 0:
+                return output[:_head_end(output, n)]
+            return '\n'.join(output.split('\n')[:n])
         
         elif line_spec.startswith('-') and ',' not in line_spec:
             # "-N" - Last N lines
             n = int(line_spec[1:])
-            selected_lines = lines[-n:] if n <= total_lines else lines
-            return '\n'.join(selected_lines)
+            if n > 0:
+                return output[_tail_start(output, n):]
+            return '\n'.join(output.split('\n')[-n:])
         
         elif ',' in line_spec:
             # "+N,-M" - First N + last M lines
@@ -145,21 +171,34 @@ class OutputCache:
             first_n = int(parts[0][1:])  # Remove '+'
             last_m = int(parts[1][1:])   # Remove '-'
             
+            total_lines = output.count('\n') + 1
+            omitted = total_lines - first_n - last_m
+            
+            # Positive counts within range: slice at the boundary newlines
+            if first_n > 0 and 0 < last_m <= total_lines:
+                first_section = output[:_head_end(output, first_n)]
+                last_section = output[_tail_start(output, last_m):]
+                if omitted <= 0:
+                    return first_section + '\n' + last_section
+                return f"{first_section}\n\n... ({omitted} lines omitted) ...\n\n{last_section}"
+            
+            # Zero or negative counts keep their list-slicing meaning
+            lines = output.split('\n')
             first_lines = lines[:first_n]
             last_lines = lines[-last_m:] if last_m <= total_lines else []
+            if omitted <= 0:
+                return '\n'.join(first_lines + last_lines)
             
             # Add omission indicator
-            omitted = total_lines - first_n - last_m
-            if omitted > 0:
-                result = '\n'.join(first_lines)
-                result += f"\n\n... ({omitted} lines omitted) ...\n\n"
-                result += '\n'.join(last_lines)
-                return result
-            else:
-                return '\n'.join(first_lines + last_lines)
+            result = '\n'.join(first_lines)
+            result += f"\n\n... ({omitted} lines omitted) ...\n\n"
+            result += '\n'.join(last_lines)
+            return result
         
         elif '-' in line_spec and not line_spec.startswith('-'):
             # "N-M" - Lines N through M (1-indexed)
+            lines = output.split('\n')
+            total_lines = len(lines)
             parts = line_spec.split('-')
             start = int(parts[0]) - 1  # Convert to 0-indexed
             end = int(parts[1])
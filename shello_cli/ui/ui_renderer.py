@@ -1,11 +1,9 @@
 """UI rendering utilities using Rich library"""
-from rich.console import Console
-from rich.markdown import Markdown
+from rich.console import Console, Group
 from rich.panel import Panel
 from rich.text import Text
 from rich.box import ROUNDED
 from pathlib import Path
-import re
 from rich.table import Table
 
 # Create console with auto-detection of width
@@ -47,15 +45,13 @@ def render_terminal_command(command, output_filter, cwd=None, user="user", hostn
         first_line.append(f"📊 Filter: {output_filter}", style="yellow")
         first_line.append("]", style="white")
     
-    console.print(first_line)
-    
     # Second line: bottom box with command
     second_line = Text()
     second_line.append("└─", style="white")
     second_line.append("$ ", style="bold yellow")
     second_line.append(command, style="bright_white bold")
     
-    console.print(second_line)
+    console.print(Group(first_line, second_line))
 
 
 def render_direct_command_output(command: str, cwd=None, user="user", hostname="win"):
@@ -90,15 +86,13 @@ def render_direct_command_output(command: str, cwd=None, user="user", hostname="
     first_line.append(short_cwd, style="bold magenta")
     first_line.append("]", style="white")
     
-    console.print(first_line)
-    
     # Second line: command with $ prompt
     second_line = Text()
     second_line.append("└─", style="white")
     second_line.append("$ ", style="bold yellow")
     second_line.append(command, style="bright_white bold")
     
-    console.print(second_line)
+    console.print(Group(first_line, second_line))
 
 
 def render_tool_execution(tool_name: str, parameters: dict, cwd=None, user="user", hostname="win"):
@@ -155,8 +149,6 @@ def render_tool_execution(tool_name: str, parameters: dict, cwd=None, user="user
     first_line.append(short_cwd, style="bold magenta")
     first_line.append("]", style="white")
     
-    console.print(first_line)
-    
     # Second line: tool name and main parameter
     second_line = Text()
     second_line.append("└─", style="white")
@@ -184,7 +176,7 @@ def render_tool_execution(tool_name: str, parameters: dict, cwd=None, user="user
         second_line.append(", ".join(param_parts), style="bright_white")
         second_line.append(")", style="white")
     
-    console.print(second_line)
+    console.print(Group(first_line, second_line))
 
 
 
@@ -293,6 +285,10 @@ def print_welcome_banner(user_info, version):
 
 def display_about(version):
     """Display about information for Shello CLI"""
+    # Imported here: rich.markdown pulls in markdown-it and pygments, which
+    # nothing else needs at startup
+    from rich.markdown import Markdown
+
     # Get current terminal width (same as welcome banner)
     width = min(console.width - 4, 120)
     
@@ -1,6 +1,8 @@
 """
 Pytest configuration and fixtures.
 """
+import sys
+
 import pytest
 from unittest.mock import Mock, patch
 from hypothesis import settings
@@ -49,3 +51,15 @@ def mock_settings_manager(request):
         yield mock_instance
 
 
+@pytest.fixture(autouse=True)
+def clear_bedrock_client_caches():
+    """Drop process-wide boto3 sessions/clients cached by the Bedrock client.
+    
+    Tests patch boto3 per test, so a client cached by an earlier test would
+    otherwise leak its mock into later ones.
+    """
+    yield
+    bedrock_client = sys.modules.get('shello_cli.api.bedrock_client')
+    if bedrock_client is not None:
+        bedrock_client._get_runtime_client.cache_clear()
+        bedrock_client._get_profile_session.cache_clear()
@@ -222,6 +222,22 @@ class TestShelloAgentUnitTests:
         assert agent is not None
         assert agent.get_chat_history() == []
     
+    def test_instruction_template_render_matches_format(self):
+        """Test the pre-split system prompt renders exactly like str.format."""
+        from shello_cli.agent.template import INSTRUCTION_TEMPLATE, render_instruction_template
+        
+        fields = dict(
+            custom_instructions="\n\nCUSTOM INSTRUCTIONS:\nbe brief",
+            tool_descriptions="- run_shell_command: Run {braced} text",
+            os_name="Linux",
+            shell="bash",
+            shell_executable="/bin/bash",
+            cwd="/home/user",
+            current_datetime="Saturday October 17, 2026 at 09:00 AM"
+        )
+        
+        assert render_instruction_template(**fields) == INSTRUCTION_TEMPLATE.format(**fields)
+    
     def test_agent_with_custom_max_rounds(self):
         """Test agent initialization with custom max_tool_rounds."""
         mock_client = _create_mock_client()
@@ -279,6 +295,24 @@ class TestShelloAgentUnitTests:
         assert entries[0].type == "assistant"
         assert entries[0].content == "Hello!"
     
+    def test_system_prompt_built_on_first_message(self):
+        """Test the system prompt is only built once the conversation starts."""
+        mock_client = _create_mock_client()
+        mock_client.chat.return_value = {
+            "choices": [{"message": {"role": "assistant", "content": "Hi", "tool_calls": None}}]
+        }
+        
+        with patch.object(ShelloAgent, "_build_system_prompt", return_value="PROMPT") as mock_build:
+            agent = ShelloAgent(client=mock_client)
+            mock_build.assert_not_called()
+            
+            agent.process_user_message("one")
+            agent.process_user_message("two")
+        
+        mock_build.assert_called_once()
+        assert agent._messages[0] == {"role": "system", "content": "PROMPT"}
+        assert [m["role"] for m in agent._messages].count("system") == 1
+    
     def test_process_message_with_tool_call(self):
         """Test processing a message that requires a tool call."""
         with patch('shello_cli.agent.tool_executor.BashTool') as MockBashTool:
@@ -7,7 +7,7 @@ Tests AWS Bedrock client functionality including chat completions.
 
 import pytest
 from unittest.mock import Mock, MagicMock, patch
-from shello_cli.api.bedrock_client import ShelloBedrockClient
+from shello_cli.api.bedrock_client import ShelloBedrockClient, BedrockResponse, _get_profile_session
 from shello_cli.types import ShelloTool
 
 
@@ -106,7 +106,35 @@ class TestBedrockClientChat:
         # Verify messages don't contain system role
         assert len(call_args['messages']) == 1
         assert call_args['messages'][0]['role'] == 'user'
-    
+
+    @patch('shello_cli.api.bedrock_client.boto3')
+    def test_chat_merges_multiple_system_messages(self, mock_boto3):
+        """Test multiple system messages are joined into one system block."""
+        mock_client = MagicMock()
+        mock_boto3.client.return_value = mock_client
+        mock_client.converse.return_value = {
+            'output': {'message': {'role': 'assistant', 'content': [{'text': 'OK'}]}},
+            'stopReason': 'end_turn',
+            'usage': {'inputTokens': 5, 'outputTokens': 1, 'totalTokens': 6}
+        }
+
+        client = ShelloBedrockClient(region="us-east-1")
+
+        messages = [
+            {"role": "system", "content": "You are a helpful assistant."},
+            {"role": "user", "content": "Run ls"},
+            {"role": "system", "content": "User interrupted the last command."},
+            {"role": "user", "content": "Try again"}
+        ]
+
+        client.chat(messages)
+
+        call_args = mock_client.converse.call_args[1]
+        assert call_args['system'] == [{
+            'text': "You are a helpful assistant.\n\nUser interrupted the last command."
+        }]
+        assert [m['role'] for m in call_args['messages']] == ['user', 'user']
+
     @patch('shello_cli.api.bedrock_client.boto3')
     def test_chat_with_tools(self, mock_boto3):
         """Test chat with tool definitions."""
@@ -213,6 +241,13 @@ class TestBedrockClientChat:
         import json
         args = json.loads(tool_call['function']['arguments'])
         assert args['location'] == 'San Francisco'
+        
+        # Only OpenAI-format fields: the tool call is stored in history as-is
+        assert set(tool_call['function']) == {'name', 'arguments'}
+        
+        # Converting the tool call back to Bedrock decodes the stored arguments
+        tool_use = client._convert_tool_call(tool_call)
+        assert tool_use['toolUse']['input'] == {'location': 'San Francisco'}
     
     @patch('shello_cli.api.bedrock_client.boto3')
     def test_chat_error_handling(self, mock_boto3):
@@ -245,6 +280,186 @@ class TestBedrockClientChat:
         assert "ValidationException" in str(exc_info.value)
         assert "Invalid request parameters" in str(exc_info.value)
 
+    @patch('shello_cli.api.bedrock_client.time.sleep')
+    @patch('shello_cli.api.bedrock_client.boto3')
+    def test_chat_retries_transient_errors(self, mock_boto3, mock_sleep):
+        """Test throttling is retried with backoff and then succeeds."""
+        from botocore.exceptions import ClientError
+        
+        mock_client = MagicMock()
+        mock_boto3.client.return_value = mock_client
+        throttled = ClientError(
+            {'Error': {'Code': 'ThrottlingException', 'Message': 'Slow down'}}, 'converse'
+        )
+        mock_client.converse.side_effect = [throttled, throttled, {
+            'output': {'message': {'role': 'assistant', 'content': [{'text': 'OK'}]}},
+            'stopReason': 'end_turn',
+            'usage': {'inputTokens': 1, 'outputTokens': 1, 'totalTokens': 2}
+        }]
+        
+        client = ShelloBedrockClient(region="us-east-1")
+        response = client.chat([{"role": "user", "content": "Hello"}])
+        
+        assert response['content'] == 'OK'
+        assert mock_client.converse.call_count == 3
+        assert mock_sleep.call_count == 2
+        # Backoff grows between attempts
+        assert mock_sleep.call_args_list[1][0][0] > mock_sleep.call_args_list[0][0][0]
+    
+    @patch('shello_cli.api.bedrock_client.time.sleep')
+    @patch('shello_cli.api.bedrock_client.boto3')
+    def test_chat_gives_up_after_max_attempts(self, mock_boto3, mock_sleep):
+        """Test retries stop after the attempt limit and the error is raised."""
+        from botocore.exceptions import ClientError
+        
+        mock_client = MagicMock()
+        mock_boto3.client.return_value = mock_client
+        mock_client.converse.side_effect = ClientError(
+            {'Error': {'Code': 'ModelNotReadyException', 'Message': 'Loading'}}, 'converse'
+        )
+        
+        client = ShelloBedrockClient(region="us-east-1")
+        with pytest.raises(Exception) as exc_info:
+            client.chat([{"role": "user", "content": "Hello"}])
+        
+        assert "ModelNotReadyException" in str(exc_info.value)
+        assert mock_client.converse.call_count == 5
+        assert mock_sleep.call_count == 4
+    
+    @pytest.mark.parametrize("code,message,expected", [
+        ('ValidationException', 'Input is too long for requested model', 'Context window exceeded'),
+        ('ValidationException', 'Prompt exceeds max TOKEN limit', 'Context window exceeded'),
+        ('ThrottlingException', 'Slow down', 'Rate limit exceeded'),
+        ('ResourceNotFoundException', 'No such model', "not available in region 'us-east-1'"),
+        ('SomeNewException', 'Something odd', 'SomeNewException - Something odd'),
+    ])
+    @patch('shello_cli.api.bedrock_client.time.sleep')
+    @patch('shello_cli.api.bedrock_client.boto3')
+    def test_chat_error_messages_by_code(self, mock_boto3, mock_sleep, code, message, expected):
+        """Test error codes map to their descriptive messages."""
+        from botocore.exceptions import ClientError
+        
+        mock_client = MagicMock()
+        mock_boto3.client.return_value = mock_client
+        mock_client.converse.side_effect = ClientError(
+            {'Error': {'Code': code, 'Message': message}}, 'converse'
+        )
+        
+        client = ShelloBedrockClient(region="us-east-1")
+        
+        with pytest.raises(Exception) as exc_info:
+            client.chat([{"role": "user", "content": "Hello"}])
+        
+        assert str(exc_info.value).startswith("Bedrock API error: ")
+        assert expected in str(exc_info.value)
+        assert message in str(exc_info.value)
+
+
+class TestBedrockClientChatAsync:
+    """Unit tests for the chat_async method."""
+    
+    @patch('shello_cli.api.bedrock_client.boto3')
+    def test_chat_async_runs_requests_concurrently(self, mock_boto3):
+        """Test chat_async returns chat() results and can be awaited together."""
+        import anyio
+        
+        mock_client = MagicMock()
+        mock_boto3.client.return_value = mock_client
+        mock_client.converse.return_value = {
+            'output': {'message': {'role': 'assistant', 'content': [{'text': 'Done'}]}},
+            'stopReason': 'end_turn',
+            'usage': {'inputTokens': 1, 'outputTokens': 1, 'totalTokens': 2}
+        }
+        
+        client = ShelloBedrockClient(region="us-east-1")
+        results = []
+        
+        async def main():
+            async def one(text):
+                results.append(await client.chat_async([{"role": "user", "content": text}]))
+            
+            async with anyio.create_task_group() as tg:
+                for text in ("a", "b", "c"):
+                    tg.start_soon(one, text)
+        
+        anyio.run(main)
+        
+        assert len(results) == 3
+        assert all(r['content'] == 'Done' for r in results)
+        assert mock_client.converse.call_count == 3
+
+
+class TestBedrockResponseParsing:
+    """Unit tests for _parse_response and BedrockResponse."""
+    
+    @patch('shello_cli.api.bedrock_client.boto3')
+    def test_parse_response_returns_immutable_result(self, mock_boto3):
+        """Test _parse_response returns a frozen BedrockResponse."""
+        import dataclasses
+        
+        client = ShelloBedrockClient(region="us-east-1")
+        parsed = client._parse_response({
+            'output': {'message': {'role': 'assistant', 'content': [{'text': 'Hi'}]}},
+            'stopReason': 'end_turn',
+            'usage': {'inputTokens': 1, 'outputTokens': 1, 'totalTokens': 2}
+        })
+        
+        assert isinstance(parsed, BedrockResponse)
+        assert parsed.content == 'Hi'
+        assert parsed.tool_calls == ()
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            parsed.content = 'changed'
+    
+    def test_to_dict_omits_tool_calls_when_empty(self):
+        """Test to_dict only includes toolCalls when tool calls are present."""
+        usage = {'inputTokens': 1, 'outputTokens': 1, 'totalTokens': 2}
+        plain = BedrockResponse(content='Hi', role='assistant', stop_reason='end_turn', usage=usage)
+        assert plain.to_dict() == {
+            'content': 'Hi',
+            'role': 'assistant',
+            'stopReason': 'end_turn',
+            'usage': usage
+        }
+        
+        tool_call = {'id': 't1', 'type': 'function', 'function': {'name': 'x', 'arguments': '{}'}}
+        with_tools = BedrockResponse(
+            content='', role='assistant', stop_reason='tool_use', usage=usage,
+            tool_calls=(tool_call,)
+        )
+        assert with_tools.to_dict()['toolCalls'] == [tool_call]
+
+
+class TestBedrockClientToolConfigCache:
+    """Unit tests for toolConfig caching."""
+    
+    @patch('shello_cli.api.bedrock_client.boto3')
+    def test_tool_config_reused_across_calls(self, mock_boto3):
+        """Test the same tools produce the same cached toolConfig."""
+        mock_client = MagicMock()
+        mock_boto3.client.return_value = mock_client
+        mock_client.converse.return_value = {
+            'output': {'message': {'role': 'assistant', 'content': [{'text': 'OK'}]}},
+            'stopReason': 'end_turn',
+            'usage': {'inputTokens': 1, 'outputTokens': 1, 'totalTokens': 2}
+        }
+        
+        client = ShelloBedrockClient(region="us-east-1")
+        tools = [ShelloTool(type="function", function={
+            "name": "run_shell_command",
+            "description": "Execute bash command",
+            "parameters": {"type": "object", "properties": {}}
+        })]
+        
+        with patch.object(ShelloBedrockClient, '_format_tools', wraps=client._format_tools) as spy:
+            client.chat([{"role": "user", "content": "one"}], tools=list(tools))
+            client.chat([{"role": "user", "content": "two"}], tools=list(tools))
+        
+        assert spy.call_count == 1
+        first = mock_client.converse.call_args_list[0][1]['toolConfig']
+        second = mock_client.converse.call_args_list[1][1]['toolConfig']
+        assert first is second
+        assert first['tools'][0]['toolSpec']['name'] == 'run_shell_command'
+
 
 class TestBedrockClientInitialization:
     """Unit tests for client initialization."""
@@ -286,6 +501,7 @@ class TestBedrockClientInitialization:
     @patch('shello_cli.api.bedrock_client.boto3')
     def test_initialization_with_profile(self, mock_boto3):
         """Test initialization with AWS profile."""
+        _get_profile_session.cache_clear()
         mock_session = MagicMock()
         mock_client = MagicMock()
         mock_boto3.Session.return_value = mock_session
@@ -300,6 +516,37 @@ class TestBedrockClientInitialization:
         mock_boto3.Session.assert_called_once_with(profile_name="my-profile")
         mock_session.client.assert_called_once()
     
+    @patch('shello_cli.api.bedrock_client.boto3')
+    def test_clients_share_session_and_config(self, mock_boto3):
+        """Test clients for the same profile reuse Session and share Config per region."""
+        _get_profile_session.cache_clear()
+        mock_session = MagicMock()
+        mock_boto3.Session.return_value = mock_session
+        
+        ShelloBedrockClient(region="eu-west-1", aws_profile="shared-profile")
+        ShelloBedrockClient(region="eu-west-2", aws_profile="shared-profile")
+        ShelloBedrockClient(region="eu-west-2", model="other-model", aws_profile="shared-profile")
+        
+        mock_boto3.Session.assert_called_once_with(profile_name="shared-profile")
+        assert mock_session.client.call_count == 2
+        first_config = mock_session.client.call_args_list[0][1]['config']
+        assert first_config.tcp_keepalive is True
+        assert first_config.region_name == "eu-west-1"
+    
+    @patch('shello_cli.api.bedrock_client.boto3')
+    def test_clients_with_same_connection_share_runtime_client(self, mock_boto3):
+        """Test that a new client for the same connection reuses the boto3 client."""
+        mock_boto3.client.side_effect = lambda **kwargs: MagicMock()
+        
+        first = ShelloBedrockClient(region="us-west-2", model="model-a")
+        second = ShelloBedrockClient(region="us-west-2", model="model-b")
+        other_region = ShelloBedrockClient(region="ap-south-1")
+        
+        assert first._client is second._client
+        assert other_region._client is not first._client
+        assert mock_boto3.client.call_count == 2
+        assert second.get_current_model() == "model-b"
+    
     def test_initialization_without_region_raises_error(self):
         """Test that initializing without region raises ValueError."""
         with pytest.raises(ValueError, match="Region cannot be None or empty"):
@@ -402,6 +649,55 @@ class TestBedrockClientStreaming:
         assert 'finish_reason' in chunks[-1]['choices'][0]
         assert chunks[-1]['choices'][0]['finish_reason'] == 'stop'
     
+    @patch('shello_cli.api.bedrock_client.boto3')
+    def test_chat_stream_yields_usage(self, mock_boto3):
+        """Test streaming ends with an OpenAI-style usage chunk; raw usage via get_last_usage."""
+        mock_client = MagicMock()
+        mock_boto3.client.return_value = mock_client
+        usage = {'inputTokens': 12, 'outputTokens': 3, 'totalTokens': 15}
+        mock_client.converse_stream.return_value = {'stream': [
+            {'contentBlockDelta': {'delta': {'text': 'Hi'}}},
+            {'messageStop': {'stopReason': 'end_turn'}},
+            {'metadata': {'usage': usage, 'metrics': {'latencyMs': 120}}}
+        ]}
+        
+        client = ShelloBedrockClient(region="us-east-1")
+        assert client.get_last_usage() is None
+        
+        chunks = list(client.chat_stream([{"role": "user", "content": "Hello"}]))
+        
+        usage_chunks = [c for c in chunks if 'usage' in c]
+        assert len(usage_chunks) == 1
+        assert usage_chunks[0] is chunks[-1]
+        assert usage_chunks[0]['choices'] == []
+        assert usage_chunks[0]['usage'] == {
+            'prompt_tokens': 12, 'completion_tokens': 3, 'total_tokens': 15
+        }
+        assert usage_chunks[0]['metrics'] == {'latencyMs': 120}
+        assert client.get_last_usage() == usage
+    
+    @patch('shello_cli.api.bedrock_client.boto3')
+    def test_chat_stream_coalesces_text_deltas(self, mock_boto3):
+        """Test coalesce_ms merges small text deltas and flushes before other chunks."""
+        mock_client = MagicMock()
+        mock_boto3.client.return_value = mock_client
+        mock_client.converse_stream.return_value = {'stream': [
+            {'contentBlockDelta': {'delta': {'text': 'Hel'}}},
+            {'contentBlockDelta': {'delta': {'text': 'lo'}}},
+            {'contentBlockDelta': {'delta': {'text': ' world'}}},
+            {'messageStop': {'stopReason': 'end_turn'}}
+        ]}
+        
+        client = ShelloBedrockClient(region="us-east-1")
+        chunks = list(client.chat_stream(
+            [{"role": "user", "content": "Hello"}], coalesce_ms=60_000
+        ))
+        
+        text_chunks = [c for c in chunks if c['choices'] and c['choices'][0]['delta'].get('content')]
+        assert [c['choices'][0]['delta']['content'] for c in text_chunks] == ['Hello world']
+        assert chunks.index(text_chunks[0]) < len(chunks) - 1
+        assert chunks[-1]['choices'][0]['finish_reason'] == 'stop'
+    
     @patch('shello_cli.api.bedrock_client.boto3')
     def test_chat_stream_with_tool_use(self, mock_boto3):
         """Test streaming chat with tool use."""
@@ -504,6 +800,23 @@ class TestBedrockClientStreaming:
         assert 'content' in delta
         assert 'Error' in delta['content']
         assert 'ThrottlingException' in delta['content']
+    
+    @patch('shello_cli.api.bedrock_client.boto3')
+    def test_chat_stream_error_matches_chat_wording(self, mock_boto3):
+        """Test streaming errors use the same descriptive text as chat()."""
+        from botocore.exceptions import ClientError
+        
+        mock_client = MagicMock()
+        mock_boto3.client.return_value = mock_client
+        error_response = {'Error': {'Code': 'ValidationException', 'Message': 'Input is TOO LONG'}}
+        mock_client.converse_stream.side_effect = ClientError(error_response, 'converse_stream')
+        
+        client = ShelloBedrockClient(region="us-east-1")
+        chunks = list(client.chat_stream([{"role": "user", "content": "Hello"}]))
+        
+        content = chunks[0]['choices'][0]['delta']['content']
+        assert client._describe_client_error('ValidationException', 'Input is TOO LONG') in content
+        assert 'Context window exceeded' in content
 
 
 
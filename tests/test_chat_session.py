@@ -0,0 +1,280 @@
+"""
+Unit tests for ChatSession streaming display and recording.
+"""
+
+from unittest.mock import Mock
+
+from shello_cli.agent.models import StreamingChunk
+from shello_cli.chat.chat_session import ChatSession
+
+
+def _make_session(chunks):
+    """Create a ChatSession whose agent streams the given chunks."""
+    agent = Mock()
+    agent.process_user_message_stream.return_value = iter(chunks)
+    agent.get_current_directory.return_value = "/tmp"
+    recorder = Mock()
+    recorder.is_recording = True
+    return ChatSession(agent, recorder=recorder), recorder
+
+
+def _recorded_ai_responses(recorder):
+    return [
+        call.args[0].content
+        for call in recorder.record.call_args_list
+        if call.args[0].entry_type == "ai_response"
+    ]
+
+
+class TestChatSessionStreaming:
+    """Tests for content accumulation in _process_message."""
+    
+    def test_streamed_content_is_recorded_once_joined(self):
+        """Test content pieces are joined into a single ai_response entry."""
+        session, recorder = _make_session([
+            StreamingChunk(type="content", content="Hello"),
+            StreamingChunk(type="content", content=", "),
+            StreamingChunk(type="content", content="world"),
+            StreamingChunk(type="done"),
+        ])
+        
+        session._process_message("hi")
+        
+        assert _recorded_ai_responses(recorder) == ["Hello, world"]
+        recorder.record_api_message.assert_called_with(
+            {"role": "assistant", "content": "Hello, world"}
+        )
+    
+    def test_content_sections_reset_at_tool_calls(self):
+        """Test content before and after tool calls is recorded as separate sections."""
+        tool_call = {
+            "id": "call_1",
+            "type": "function",
+            "function": {"name": "get_cached_output", "arguments": "{}"}
+        }
+        session, recorder = _make_session([
+            StreamingChunk(type="content", content="Let me "),
+            StreamingChunk(type="content", content="check."),
+            StreamingChunk(type="tool_calls", tool_calls=[tool_call]),
+            StreamingChunk(type="content", content="Done."),
+            StreamingChunk(type="done"),
+        ])
+        
+        session._process_message("hi")
+        
+        assert _recorded_ai_responses(recorder) == ["Let me check.", "Done."]
+    
+    def test_live_updates_are_throttled_and_flushed(self):
+        """Test rapid content chunks re-render once, then the final text is shown."""
+        from unittest.mock import MagicMock, patch
+        
+        session, _ = _make_session([
+            StreamingChunk(type="content", content="a"),
+            StreamingChunk(type="content", content="b"),
+            StreamingChunk(type="content", content="c"),
+            StreamingChunk(type="done"),
+        ])
+        
+        with patch("shello_cli.chat.chat_session.Live") as mock_live_cls, \
+             patch("shello_cli.chat.chat_session.time.monotonic", return_value=100.0), \
+             patch("shello_cli.chat.chat_session.console") as mock_console:
+            mock_console.is_terminal = True
+            live = MagicMock()
+            mock_live_cls.return_value.__enter__.return_value = live
+            
+            session._process_message("hi")
+        
+        rendered = [call.args[0].markup for call in live.update.call_args_list]
+        assert rendered == ["a", "abc"]
+        # No background refresh thread; throttled updates redraw explicitly
+        assert mock_live_cls.call_args.kwargs["auto_refresh"] is False
+        assert live.update.call_args_list[0].kwargs == {"refresh": True}
+        live.stop.assert_called_once()
+    
+    def test_open_code_fence_reuses_parsed_prefix(self):
+        """Test an unclosed code fence is shown as text after a cached markdown prefix."""
+        from rich.console import Group
+        from shello_cli.chat.chat_session import _streaming_markdown
+        from shello_cli.ui.custom_markdown import EnhancedMarkdown
+        
+        cache = {}
+        first, complete = _streaming_markdown("Intro\n```py\nx = 1\n", cache)
+        assert not complete and isinstance(first, Group)
+        second, _ = _streaming_markdown("Intro\n```py\nx = 1\ny = 2\n", cache)
+        assert second.renderables[0] is first.renderables[0]
+        assert second.renderables[1].plain == "```py\nx = 1\ny = 2\n"
+        
+        closed, complete = _streaming_markdown("Intro\n```py\nx = 1\n```\n", cache)
+        assert complete and isinstance(closed, EnhancedMarkdown)
+    
+    def test_open_code_fence_rendered_as_markdown_when_stream_ends(self):
+        """Test the final display is full markdown even if the last update was mid-fence."""
+        import itertools
+        from unittest.mock import MagicMock, patch
+        from shello_cli.ui.custom_markdown import EnhancedMarkdown
+        
+        session, _ = _make_session([
+            StreamingChunk(type="content", content="```py\n"),
+            StreamingChunk(type="content", content="x = 1\n"),
+            StreamingChunk(type="done"),
+        ])
+        
+        with patch("shello_cli.chat.chat_session.Live") as mock_live_cls, \
+             patch("shello_cli.chat.chat_session.time.monotonic", side_effect=itertools.count(100)), \
+             patch("shello_cli.chat.chat_session.console") as mock_console:
+            mock_console.is_terminal = True
+            live = MagicMock()
+            mock_live_cls.return_value.__enter__.return_value = live
+            
+            session._process_message("hi")
+        
+        final = live.update.call_args_list[-1].args[0]
+        assert isinstance(final, EnhancedMarkdown)
+        assert final.markup == "```py\nx = 1\n"
+    
+    def test_no_live_display_when_not_a_terminal(self):
+        """Test piped output skips Live and prints each section once."""
+        from unittest.mock import patch
+        from shello_cli.chat import chat_session
+        
+        session, _ = _make_session([
+            StreamingChunk(type="content", content="a"),
+            StreamingChunk(type="content", content="b"),
+            StreamingChunk(type="done"),
+        ])
+        
+        with patch("shello_cli.chat.chat_session.Live") as mock_live_cls, \
+             patch("shello_cli.chat.chat_session.console") as mock_console, \
+             patch.object(chat_session, "EnhancedMarkdown") as mock_markdown:
+            mock_console.is_terminal = False
+            
+            session._process_message("hi")
+        
+        mock_live_cls.assert_not_called()
+        mock_markdown.assert_called_once_with("ab")
+        mock_console.print.assert_any_call(mock_markdown.return_value)
+    
+    def test_markdown_built_once_per_section_at_tool_calls(self):
+        """Test tool-call boundaries never parse the same section's markdown twice."""
+        from unittest.mock import MagicMock, patch
+        from shello_cli.chat import chat_session
+        
+        session, _ = _make_session([
+            StreamingChunk(type="content", content="Let me"),
+            StreamingChunk(type="content", content=" check."),
+            StreamingChunk(type="tool_calls", tool_calls=[{"id": "1"}]),
+            StreamingChunk(type="content", content="Done."),
+            StreamingChunk(type="done"),
+        ])
+        
+        with patch("shello_cli.chat.chat_session.Live") as mock_live_cls, \
+             patch("shello_cli.chat.chat_session.time.monotonic", return_value=100.0), \
+             patch("shello_cli.chat.chat_session.console"), \
+             patch.object(chat_session, "EnhancedMarkdown") as mock_markdown:
+            mock_live_cls.return_value.__enter__.return_value = MagicMock()
+            
+            session._process_message("hi")
+        
+        built = [call.args[0] for call in mock_markdown.call_args_list]
+        assert built.count("Let me check.") == 1
+        assert built.count("Done.") == 1
+    
+    def test_tool_call_arguments_parsed_once(self):
+        """Test tool-call arguments are parsed once for tracking, rendering and recording."""
+        from unittest.mock import patch
+        from shello_cli.chat import chat_session
+        
+        tool_call = {
+            "id": "call_1",
+            "type": "function",
+            "function": {"name": "run_shell_command", "arguments": '{"command": "ls"}'}
+        }
+        session, recorder = _make_session([
+            StreamingChunk(type="tool_call", tool_call=tool_call),
+            StreamingChunk(type="done"),
+        ])
+        
+        with patch("shello_cli.chat.chat_session.render_tool_execution") as mock_render, \
+             patch.object(chat_session.json, "loads", wraps=chat_session.json.loads) as mock_loads:
+            session._process_message("hi")
+        
+        assert mock_loads.call_count == 1
+        assert mock_render.call_args.kwargs["parameters"] == {"command": "ls"}
+        executions = [
+            call.args[0] for call in recorder.record.call_args_list
+            if call.args[0].entry_type == "tool_execution"
+        ]
+        assert executions[0].metadata["parameters"] == {"command": "ls"}
+        # The working directory is read once and shared by rendering and recording
+        session.agent.get_current_directory.assert_called_once()
+        assert mock_render.call_args.kwargs["cwd"] == executions[0].metadata["cwd"] == "/tmp"
+
+
+    def test_tool_output_written_without_rich_formatting(self):
+        """Test streamed tool output bypasses markup, highlighting and wrapping."""
+        from unittest.mock import patch
+        
+        session, _ = _make_session([
+            StreamingChunk(type="tool_output", content="[bold]total 42[/bold]\n"),
+            StreamingChunk(type="done"),
+        ])
+        
+        with patch("shello_cli.chat.chat_session.console") as mock_console:
+            mock_console.is_terminal = False
+            session._process_message("hi")
+        
+        mock_console.out.assert_called_once_with("[bold]total 42[/bold]\n", end="", highlight=False)
+
+
+class TestChatSessionEnvironment:
+    """Tests for per-process caching of session environment details."""
+    
+    def test_environment_looked_up_once_but_cwd_is_fresh(self, tmp_path, monkeypatch):
+        """Test user/hostname/shell are cached while cwd reflects each new session."""
+        from unittest.mock import patch
+        from shello_cli.chat import chat_session
+        
+        chat_session._session_environment.cache_clear()
+        try:
+            with patch.object(chat_session.socket, "gethostname", return_value="host") as mock_host:
+                first = ChatSession(Mock())
+                monkeypatch.chdir(tmp_path)
+                second = ChatSession(Mock())
+            
+            assert mock_host.call_count == 1
+            assert first.hostname == second.hostname == "host"
+            assert second.system_info["cwd"] == str(tmp_path)
+            assert first.system_info["shell"] == second.system_info["shell"]
+        finally:
+            chat_session._session_environment.cache_clear()
+    
+    def test_start_conversation_context(self):
+        """Test the first message carries system information, date and the user message."""
+        from unittest.mock import patch
+        
+        session = ChatSession(Mock())
+        with patch.object(ChatSession, "_process_message") as mock_process:
+            session.start_conversation("list files")
+        
+        context = mock_process.call_args.args[0]
+        assert context.startswith("Current system information:\n- OS: ")
+        assert f"- Working Directory: {session.system_info['cwd']}\n- Date/Time: " in context
+        assert context.endswith("\n\nUser message: list files")
+        assert session.conversation_started
+    
+    def test_direct_command_context_reaches_both_turns(self):
+        """Test ai_context is sent with first and later messages but not recorded."""
+        from unittest.mock import patch
+        
+        session = ChatSession(Mock())
+        with patch.object(ChatSession, "_process_message") as mock_process, \
+             patch.object(ChatSession, "_record_user_prompt") as mock_record:
+            session.start_conversation("why?", ai_context="✓ [/tmp] $ ls")
+            session.continue_conversation("and now?", ai_context="✗ [/tmp] $ cat x")
+            session.continue_conversation("thanks")
+        
+        first, second, third = (c.args[0] for c in mock_process.call_args_list)
+        assert first.endswith("User message: ✓ [/tmp] $ ls\n\nUser query: why?")
+        assert second == "✗ [/tmp] $ cat x\n\nUser query: and now?"
+        assert third == "thanks"
+        assert [c.args[0] for c in mock_record.call_args_list] == ["why?", "and now?", "thanks"]
@@ -49,6 +49,26 @@ class TestCreateClientOpenAI:
             assert isinstance(client, ShelloClient)
             assert client.get_current_model() == "gpt-4o"
     
+    def test_create_openai_client_uses_session_debug_level(self):
+        """Test the OpenAI client logs at the debug level set for the session."""
+        from shello_cli.api import DEBUG_SUMMARY
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            manager = SettingsManager()
+            manager._user_settings_path = Path(temp_dir) / "user-settings.json"
+            manager.save_user_settings(UserSettings(
+                provider="openai",
+                openai_config=ProviderConfig(provider_type="openai", api_key="test-api-key")
+            ))
+            
+            assert create_client(manager)._debug_level == 0
+            
+            manager.set_debug_level_for_session(DEBUG_SUMMARY)
+            client = create_client(manager)
+            
+            assert client._debug_level == DEBUG_SUMMARY
+            assert client._client._client.event_hooks["request"]
+    
     def test_create_openai_client_with_env_api_key(self):
         """Test creating ShelloClient with API key from environment variable."""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -157,6 +177,25 @@ class TestCreateClientBedrock:
             assert isinstance(client, ShelloBedrockClient)
             assert client.get_current_model() == "anthropic.claude-3-5-sonnet-20241022-v2:0"
     
+    @patch('shello_cli.api.bedrock_client.boto3')
+    def test_create_bedrock_client_uses_session_debug_level(self, mock_boto3):
+        """Test any session debug level enables Bedrock request/response logging."""
+        from shello_cli.api import DEBUG_SUMMARY
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            manager = SettingsManager()
+            manager._user_settings_path = Path(temp_dir) / "user-settings.json"
+            manager.save_user_settings(UserSettings(
+                provider="bedrock",
+                bedrock_config=ProviderConfig(provider_type="bedrock", aws_region="us-east-1")
+            ))
+            
+            assert create_client(manager)._debug is False
+            
+            manager.set_debug_level_for_session(DEBUG_SUMMARY)
+            
+            assert create_client(manager)._debug is True
+    
     @patch('shello_cli.api.bedrock_client.boto3')
     def test_create_bedrock_client_with_explicit_credentials(self, mock_boto3):
         """Test creating ShelloBedrockClient with explicit AWS credentials."""
@@ -245,7 +284,11 @@ class TestCreateClientBoto3Import:
             
             # Mock the import to raise ImportError
             with patch.dict(sys.modules, {'shello_cli.api.bedrock_client': None}):
-                with patch('shello_cli.api.client_factory._create_bedrock_client') as mock_create:
+                mock_create = Mock()
+                with patch.dict(
+                    'shello_cli.api.client_factory._PROVIDER_FACTORIES',
+                    {'bedrock': mock_create}
+                ):
                     mock_create.side_effect = ValueError(
                         "AWS Bedrock support requires boto3. "
                         "Install it with: uv pip install boto3 (or pip install boto3)"
@@ -392,3 +435,31 @@ class TestCreateClientDefaultModel:
             
             # Should use default Bedrock model
             assert client.get_current_model() == "anthropic.claude-3-5-sonnet-20241022-v2:0"
+
+
+class TestRegisterProvider:
+    """Unit tests for the provider registry."""
+    
+    def test_registered_provider_is_used(self):
+        """Test that create_client dispatches to a registered factory."""
+        from shello_cli.api import client_factory
+        
+        manager = Mock()
+        custom_client = Mock()
+        factory = Mock(return_value=custom_client)
+        
+        with patch.dict(client_factory._PROVIDER_FACTORIES):
+            client_factory.register_provider("custom", factory)
+            
+            assert create_client(manager, provider="custom") is custom_client
+            factory.assert_called_once_with(manager)
+        
+        assert "custom" not in client_factory._PROVIDER_FACTORIES
+    
+    def test_unknown_provider_lists_supported_providers(self):
+        """Test that an unknown provider raises with the registered names."""
+        with pytest.raises(ValueError) as exc_info:
+            create_client(Mock(), provider="unknown")
+        
+        assert "Unknown provider: 'unknown'" in str(exc_info.value)
+        assert "openai, bedrock" in str(exc_info.value)
@@ -216,3 +216,22 @@ class TestCommandDetectorUnitTests:
         assert result_lower.command == "ls"
         assert result_upper.command == "ls"
         assert result_mixed.command == "ls"
+    
+    def test_slash_commands_detected_as_internal(self):
+        """Test that chat slash commands are classified as internal commands."""
+        detector = CommandDetector()
+        
+        for text, expected in [("/new", "/new"), ("/QUIT", "/quit"),
+                               (" /help ", "/help"), ("/update --force", "/update --force"),
+                               ("/history delete", "/history delete")]:
+            result = detector.detect(text)
+            assert result.input_type == InputType.INTERNAL_COMMAND
+            assert result.command == expected
+    
+    def test_paths_are_not_internal_commands(self):
+        """Test that inputs starting with a path are not taken for slash commands."""
+        detector = CommandDetector()
+        
+        result = detector.detect("/usr/bin/env")
+        
+        assert result.input_type != InputType.INTERNAL_COMMAND
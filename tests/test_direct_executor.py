@@ -256,3 +256,57 @@ class TestDirectExecutorUnitTests:
         assert current_dir
         assert os.path.exists(current_dir)
         assert os.path.isdir(current_dir)
+    
+    def test_on_output_receives_lines_as_produced(self):
+        """Test that on_output gets each stdout line and the result keeps the full output."""
+        executor = DirectExecutor()
+        lines = []
+        
+        result = executor.execute('echo', 'first && echo second', on_output=lines.append)
+        
+        assert result.success
+        assert lines == ['first\n', 'second\n']
+        assert result.output == 'first\nsecond\n'
+    
+    def test_on_output_failed_command_keeps_stderr(self):
+        """Test that streamed execution still reports stderr for failed commands."""
+        executor = DirectExecutor()
+        lines = []
+        
+        result = executor.execute('nonexistentcommand12345', on_output=lines.append)
+        
+        assert not result.success
+        assert result.error
+        assert lines == []
+    
+    @pytest.mark.skipif(platform.system() == 'Windows', reason="POSIX shell syntax")
+    def test_on_output_timeout_kills_whole_pipeline(self):
+        """Test that streamed execution times out even when children hold stdout open."""
+        import subprocess
+        import time
+        
+        executor = DirectExecutor()
+        lines = []
+        
+        start = time.monotonic()
+        with pytest.raises(subprocess.TimeoutExpired):
+            executor._run_streaming('echo hi; sleep 5 | cat', True, lines.append, timeout=1)
+        
+        assert time.monotonic() - start < 3
+        assert lines == ['hi\n']
+    
+    @pytest.mark.skipif(platform.system() == 'Windows', reason="POSIX shell syntax")
+    def test_on_output_error_stops_command(self):
+        """Test that an exception from on_output kills the command and propagates."""
+        import time
+        
+        def _fail(line):
+            raise RuntimeError("display failed")
+        
+        executor = DirectExecutor()
+        
+        start = time.monotonic()
+        with pytest.raises(RuntimeError):
+            executor._run_streaming('echo hi; sleep 5', True, _fail, timeout=30)
+        
+        assert time.monotonic() - start < 3
@@ -263,6 +263,11 @@ class TestMessageProcessorScenarios(unittest.TestCase):
         assistant_msg = self.messages[1]
         self.assertEqual(assistant_msg["role"], "assistant")
         self.assertIn("tool_calls", assistant_msg)
+        # Argument fragments are joined back into the full JSON string
+        self.assertEqual(
+            assistant_msg["tool_calls"][0]["function"]["arguments"],
+            '{"command": "echo test"}'
+        )
         # Content should be None or empty string
         self.assertIn(assistant_msg["content"], [None, ""])
     
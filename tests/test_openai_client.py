@@ -96,3 +96,231 @@ class TestShelloClientUnitTests:
         for model in models:
             client.set_model(model)
             assert client.get_current_model() == model
+    
+    def test_tools_dicts_are_reused_for_same_tools(self):
+        """Test converted tool dictionaries are cached per tool set."""
+        from shello_cli.types import ShelloTool
+        
+        client = ShelloClient(api_key="test-key")
+        tools = [
+            ShelloTool(type="function", function={"name": "a", "parameters": {}}),
+            ShelloTool(type="function", function={"name": "b", "parameters": {}}),
+        ]
+        
+        first = client._get_tools_dicts(tools)
+        # A new list holding the same tool objects hits the cache
+        second = client._get_tools_dicts(list(tools))
+        
+        assert first is second
+        assert first == [
+            {"type": "function", "function": {"name": "a", "parameters": {}}},
+            {"type": "function", "function": {"name": "b", "parameters": {}}},
+        ]
+        
+        # A different tool set is converted separately
+        other = client._get_tools_dicts(tools[:1])
+        assert other is not first
+        assert len(other) == 1
+    
+    def test_tools_cache_is_bounded(self):
+        """Test the tools cache evicts old entries."""
+        from shello_cli.types import ShelloTool
+        from shello_cli.api.openai_client import _TOOLS_CACHE_SIZE
+        
+        client = ShelloClient(api_key="test-key")
+        for i in range(_TOOLS_CACHE_SIZE + 3):
+            client._get_tools_dicts([ShelloTool(type="function", function={"name": f"t{i}"})])
+        
+        assert len(client._tools_cache) == _TOOLS_CACHE_SIZE
+    
+    def test_chunk_to_dict_matches_model_dump_fields(self):
+        """Test streamed chunks keep the fields consumers read from model_dump()."""
+        from openai.types.chat import ChatCompletionChunk
+        from shello_cli.api.openai_client import _chunk_to_dict
+        
+        chunk = ChatCompletionChunk.model_validate({
+            "id": "chatcmpl-1",
+            "object": "chat.completion.chunk",
+            "created": 0,
+            "model": "gpt-4o",
+            "choices": [{
+                "index": 0,
+                "delta": {
+                    "content": None,
+                    "tool_calls": [{
+                        "index": 0,
+                        "id": "call_1",
+                        "type": "function",
+                        "function": {"name": "run_shell_command", "arguments": "{\"comm"}
+                    }]
+                },
+                "finish_reason": None
+            }]
+        })
+        
+        converted = _chunk_to_dict(chunk)
+        dumped = chunk.model_dump()
+        
+        assert converted["choices"][0]["delta"]["tool_calls"] == dumped["choices"][0]["delta"]["tool_calls"]
+        assert converted["choices"][0]["delta"]["content"] is None
+        assert converted["choices"][0]["finish_reason"] is None
+        assert "usage" not in converted
+    
+    def test_chunk_to_dict_handles_empty_choices_and_usage(self):
+        """Test usage-only chunks (empty choices) are converted."""
+        from openai.types.chat import ChatCompletionChunk
+        from shello_cli.api.openai_client import _chunk_to_dict
+        
+        chunk = ChatCompletionChunk.model_validate({
+            "id": "chatcmpl-1",
+            "object": "chat.completion.chunk",
+            "created": 0,
+            "model": "gpt-4o",
+            "choices": [],
+            "usage": {"prompt_tokens": 3, "completion_tokens": 2, "total_tokens": 5}
+        })
+        
+        converted = _chunk_to_dict(chunk)
+        
+        assert converted["choices"] == []
+        assert converted["usage"]["total_tokens"] == 5
+    
+    def test_debug_level_summary_skips_body_parsing(self, capsys):
+        """Test summary-level debug logging prints one line without parsing the body."""
+        import httpx
+        from unittest.mock import patch
+        from shello_cli.api.openai_client import DEBUG_SUMMARY, DEBUG_OFF
+        
+        client = ShelloClient(api_key="test-key", debug_level=DEBUG_SUMMARY)
+        request = httpx.Request(
+            "POST", "https://api.example.com/v1/chat/completions",
+            json={"model": "gpt-4o", "messages": [{"role": "user", "content": "hi"}]}
+        )
+        
+        with patch("shello_cli.api.openai_client.json.loads") as mock_loads:
+            client._log_request(request)
+            mock_loads.assert_not_called()
+        
+        output = capsys.readouterr().out
+        assert "OPENAI API REQUEST POST https://api.example.com/v1/chat/completions" in output
+        assert "Messages" not in output
+        
+        # Level can be lowered at runtime to silence the hooks
+        client.set_debug_level(DEBUG_OFF)
+        client._log_request(request)
+        assert capsys.readouterr().out == ""
+    
+    def test_debug_flag_defaults_to_verbose_logging(self):
+        """Test debug=True selects DEBUG_VERBOSE, dumping streaming requests too."""
+        from shello_cli.api.openai_client import DEBUG_VERBOSE, DEBUG_OFF
+        
+        assert ShelloClient(api_key="test-key", debug=True)._debug_level == DEBUG_VERBOSE
+        assert ShelloClient(api_key="test-key")._debug_level == DEBUG_OFF
+    
+    def test_set_debug_level_installs_hooks_on_plain_client(self):
+        """Test raising the level on a client created without debug installs the hooks."""
+        from shello_cli.api.openai_client import DEBUG_SUMMARY, _get_shared_http_client
+        
+        client = ShelloClient(api_key="test-key", base_url="https://example.com/v1")
+        assert client._client._client is _get_shared_http_client()
+        
+        client.set_debug_level(DEBUG_SUMMARY)
+        
+        http_client = client._client._client
+        assert http_client is not _get_shared_http_client()
+        assert http_client.event_hooks["request"] == [client._log_request]
+        assert not _get_shared_http_client().event_hooks["request"]
+        assert str(client._client.base_url) == "https://example.com/v1/"
+    
+    def test_clients_share_pooled_http_client(self):
+        """Test non-debug clients share one keep-alive pool; debug clients get their own."""
+        first = ShelloClient(api_key="test-key")
+        second = ShelloClient(api_key="other-key", base_url="https://example.com/v1")
+        debug_client = ShelloClient(api_key="test-key", debug=True)
+        
+        assert first._client._client is second._client._client
+        assert debug_client._client._client is not first._client._client
+        assert debug_client._client._client.event_hooks["request"]
+    
+    def test_debug_completion_logged_from_parsed_object(self, capsys):
+        """Test full debug logging reports the completion without re-parsing the body."""
+        import httpx
+        
+        completion_body = {
+            "id": "chatcmpl-1",
+            "object": "chat.completion",
+            "created": 0,
+            "model": "gpt-4o",
+            "usage": {"prompt_tokens": 4, "completion_tokens": 2, "total_tokens": 6},
+            "choices": [{
+                "index": 0,
+                "finish_reason": "stop",
+                "message": {"role": "assistant", "content": "Hello there"}
+            }]
+        }
+        client = ShelloClient(api_key="test-key", debug=True)
+        client._client._client._transport = httpx.MockTransport(
+            lambda request: httpx.Response(200, json=completion_body)
+        )
+        
+        response = client.chat([{"role": "user", "content": "hi"}])
+        
+        assert response["choices"][0]["message"]["content"] == "Hello there"
+        output = capsys.readouterr().out
+        response_block = output.split("OPENAI API RESPONSE")[1].split("OPENAI API COMPLETION")[0]
+        assert "Content-Length" in response_block
+        assert "Model:" not in response_block
+        assert "Total tokens: 6" in output
+        assert "Content: Hello there" in output
+    
+    def test_streaming_request_summarised_unless_verbose(self, capsys):
+        """Test streaming requests log one line at DEBUG_FULL and in full at DEBUG_VERBOSE."""
+        import httpx
+        from shello_cli.api.openai_client import DEBUG_FULL, DEBUG_VERBOSE
+        
+        client = ShelloClient(api_key="test-key", debug_level=DEBUG_FULL)
+        request = httpx.Request(
+            "POST", "https://api.example.com/v1/chat/completions",
+            json={"model": "gpt-4o", "stream": True,
+                  "messages": [{"role": "user", "content": "hi"}]}
+        )
+        
+        client._log_request(request)
+        output = capsys.readouterr().out
+        assert "(stream) model=gpt-4o messages=1 tools=0" in output
+        assert "Messages" not in output
+        
+        client.set_debug_level(DEBUG_VERBOSE)
+        client._log_request(request)
+        assert "📨 Messages (1):" in capsys.readouterr().out
+    
+    def test_preview_lines_matches_split_slice(self):
+        """Test message previews keep the first lines and count the rest like split()."""
+        from shello_cli.api.openai_client import _preview_lines
+        
+        for text in ["", "one", "a\nb", "a\n" * 50, "a\n" * 60 + "end", "\n\n\n"]:
+            lines = text.split('\n')
+            preview, extra = _preview_lines(text, 50)
+            assert preview == '\n'.join(lines[:50])
+            assert extra == max(len(lines) - 50, 0)
+    
+    def test_tool_call_arguments_pretty_printed_under_label(self, capsys):
+        """Test tool-call arguments are indented under the Arguments label, raw text kept."""
+        import httpx
+        
+        client = ShelloClient(api_key="test-key", debug=True)
+        request = httpx.Request(
+            "POST", "https://api.example.com/v1/chat/completions",
+            json={"model": "gpt-4o", "messages": [{
+                "role": "assistant", "content": None,
+                "tool_calls": [
+                    {"id": "a", "function": {"name": "bash", "arguments": '{"command": "ls"}'}},
+                    {"id": "b", "function": {"name": "bash", "arguments": "not json"}},
+                ]
+            }]}
+        )
+        
+        client._log_request(request)
+        output = capsys.readouterr().out
+        assert '      Arguments:\n        {\n          "command": "ls"\n        }' in output
+        assert "        not json" in output
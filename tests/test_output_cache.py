@@ -171,6 +171,33 @@ class TestOutputCacheLineSelection:
         result = cache.get_lines(cache_id, "2-4")
         assert result == "line2\nline3\nline4"
     
+    @given(
+        output=st.text(alphabet="ab\n", max_size=60),
+        first_n=st.integers(min_value=-3, max_value=25),
+        last_m=st.integers(min_value=-3, max_value=25)
+    )
+    @settings(max_examples=200)
+    def test_head_tail_slicing_matches_line_lists(self, output, first_n, last_m):
+        """Test +N, -N and +N,-M specs select the same lines as splitting the output."""
+        cache = OutputCache()
+        cache_id = cache.store("test", output)
+        lines = output.split('\n')
+        total = len(lines)
+        
+        assert cache.get_lines(cache_id, f"+{first_n}") == '\n'.join(lines[:first_n])
+        expected_last = lines[-last_m:] if last_m <= total else lines
+        assert cache.get_lines(cache_id, f"-{last_m}") == '\n'.join(expected_last)
+        
+        first_lines = lines[:first_n]
+        last_lines = lines[-last_m:] if last_m <= total else []
+        omitted = total - first_n - last_m
+        if omitted > 0:
+            expected = ('\n'.join(first_lines) + f"\n\n... ({omitted} lines omitted) ...\n\n"
+                        + '\n'.join(last_lines))
+        else:
+            expected = '\n'.join(first_lines + last_lines)
+        assert cache.get_lines(cache_id, f"+{first_n},-{last_m}") == expected
+    
     def test_get_lines_invalid_cache_id(self):
         """Test that invalid cache ID returns None."""
         cache = OutputCache()
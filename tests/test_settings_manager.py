@@ -520,7 +520,26 @@ class TestCommandTrustConfigLoading:
             assert config.approval_mode == "user_driven"
             assert "ls" in config.allowlist
             assert "rm -rf /" in config.denylist
-    
+
+    def test_get_command_trust_config_default_is_not_shared(self):
+        """Test mutating a default command trust config does not leak into later calls."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            manager = SettingsManager()
+            manager._user_settings_path = Path(temp_dir) / "user-settings.yml"
+
+            first = manager.get_command_trust_config()
+            first.allowlist.append("custom-cmd")
+            first.denylist.clear()
+            second = manager.get_command_trust_config()
+
+            assert second is not first
+            assert "custom-cmd" not in second.allowlist
+            assert "rm -rf /" in second.denylist
+
+            # Enabling YOLO mode stores a real config, which takes precedence
+            manager.enable_yolo_mode_for_session()
+            assert manager.get_command_trust_config().yolo_mode is True
+
     def test_save_user_settings_with_command_trust(self):
         """Test saving user settings with command_trust configuration."""
         with tempfile.TemporaryDirectory() as temp_dir: